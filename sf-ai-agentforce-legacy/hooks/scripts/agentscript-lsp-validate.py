@@ -22,109 +22,79 @@ import os
 import sys
 from pathlib import Path
 
-# Add shared lsp-engine to path
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # optional: stdlib fallback
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Shared lsp-engine (added to sys.path only once a .agent file needs it)
 SCRIPT_DIR = Path(__file__).parent
 PLUGIN_ROOT = SCRIPT_DIR.parent.parent
 LSP_ENGINE_PATH = PLUGIN_ROOT.parent / "shared" / "lsp-engine"
-sys.path.insert(0, str(LSP_ENGINE_PATH))
 
 # Track validation attempts to prevent infinite loops
 ATTEMPT_FILE = Path("/tmp/agentscript_lsp_attempts.json")
 MAX_ATTEMPTS = 3
+MAX_CLEAN_ENTRIES = 100  # Cached "validated OK" entries kept across sessions
 
 
-def get_attempt_count(file_path: str) -> int:
-    """Get the current attempt count for a file."""
+def load_attempts() -> dict:
+    """Load per-file attempt entries (empty if missing or unreadable)."""
     try:
-        if ATTEMPT_FILE.exists():
-            with open(ATTEMPT_FILE, "r") as f:
-                attempts = json.load(f)
-                return attempts.get(file_path, 0)
+        return _json_loads(ATTEMPT_FILE.read_bytes())
     except Exception:
-        pass
-    return 0
+        return {}
 
 
-def increment_attempt_count(file_path: str) -> int:
-    """Increment and return the attempt count for a file."""
-    attempts = {}
-    try:
-        if ATTEMPT_FILE.exists():
-            with open(ATTEMPT_FILE, "r") as f:
-                attempts = json.load(f)
-    except Exception:
-        pass
-
-    attempts[file_path] = attempts.get(file_path, 0) + 1
-    count = attempts[file_path]
+def prune_attempts(attempts: dict) -> dict:
+    """
+    Drop entries for files that no longer exist and cap the clean entries.
 
-    try:
-        with open(ATTEMPT_FILE, "w") as f:
-            json.dump(attempts, f)
-    except Exception:
-        pass
+    Entries are kept in insertion order, so the oldest clean entries go first.
+    """
+    attempts = {path: entry for path, entry in attempts.items() if os.path.exists(path)}
+    clean = [path for path, entry in attempts.items()
+             if isinstance(entry, dict) and entry.get("last_ok")]
+    for path in clean[:-MAX_CLEAN_ENTRIES]:
+        del attempts[path]
+    return attempts
 
-    return count
 
-
-def reset_attempt_count(file_path: str):
-    """Reset attempt count when validation succeeds."""
+def save_attempts(attempts: dict):
+    """Write attempt entries atomically so concurrent hooks never see a partial file."""
+    tmp_path = ATTEMPT_FILE.with_name(f"{ATTEMPT_FILE.name}.{os.getpid()}.tmp")
     try:
-        if ATTEMPT_FILE.exists():
-            with open(ATTEMPT_FILE, "r") as f:
-                attempts = json.load(f)
-            if file_path in attempts:
-                del attempts[file_path]
-                with open(ATTEMPT_FILE, "w") as f:
-                    json.dump(attempts, f)
+        tmp_path.write_bytes(_json_dumps(attempts))
+        os.replace(tmp_path, ATTEMPT_FILE)
     except Exception:
         pass
 
 
-def main():
-    """Main hook entry point."""
-    # Read hook input from stdin
-    try:
-        hook_input = json.load(sys.stdin)
-    except json.JSONDecodeError:
-        # No input or invalid JSON - skip validation
-        sys.exit(0)
-
-    # Extract file path
-    tool_input = hook_input.get("tool_input", {})
-    file_path = tool_input.get("file_path", "")
-
-    # Only validate .agent files
-    if not file_path.endswith(".agent"):
-        sys.exit(0)
-
-    # Check if file exists
-    if not os.path.exists(file_path):
-        sys.exit(0)
-
-    # Track attempts
-    current_attempt = increment_attempt_count(file_path)
-
-    # If max attempts exceeded, skip validation to avoid infinite loop
-    if current_attempt > MAX_ATTEMPTS:
-        print(f"⚠️ LSP validation: Maximum attempts ({MAX_ATTEMPTS}) exceeded for {file_path}")
-        print("   Manual review may be required.")
-        reset_attempt_count(file_path)  # Reset for next edit session
-        sys.exit(0)
+def validate_file(file_path: str, current_attempt: int) -> bool:
+    """
+    Run LSP diagnostics on file_path and print them for Claude.
 
+    Returns True only when the LSP reports the file as valid.
+    """
     # Try to import LSP engine
+    sys.path.insert(0, str(LSP_ENGINE_PATH))
     try:
         from lsp_client import get_diagnostics, is_lsp_available
         from diagnostics import format_diagnostics_for_claude
     except ImportError as e:
         # LSP engine not available - skip validation silently
         # This allows the plugin to work even without LSP
-        sys.exit(0)
+        return False
 
     # Check if LSP is available
     if not is_lsp_available():
         # LSP not available - skip validation silently
-        sys.exit(0)
+        return False
 
     # Validate the file
     try:
@@ -132,7 +102,7 @@ def main():
     except Exception as e:
         # LSP error - report but don't block
         print(f"⚠️ LSP validation error: {e}")
-        sys.exit(0)
+        return False
 
     # Format output for Claude
     output = format_diagnostics_for_claude(
@@ -142,14 +112,69 @@ def main():
         current_attempt=current_attempt,
     )
 
-    # If valid, reset attempt counter
-    if result.get("success", False):
-        reset_attempt_count(file_path)
-
     # Output diagnostics (empty = success)
     if output:
         print(output)
 
+    return result.get("success", False)
+
+
+def main():
+    """Main hook entry point."""
+    # Read hook input from stdin
+    try:
+        hook_input = json.load(sys.stdin)
+    except json.JSONDecodeError:
+        # No input or invalid JSON - skip validation
+        sys.exit(0)
+
+    # Extract file path
+    tool_input = hook_input.get("tool_input", {})
+    file_path = tool_input.get("file_path", "")
+
+    # Only validate .agent files
+    if not file_path.endswith(".agent"):
+        sys.exit(0)
+
+    # Check if file exists
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        sys.exit(0)
+
+    # Nothing to validate yet
+    if st.st_size == 0:
+        sys.exit(0)
+
+    # A list, not a tuple, so it compares equal after a JSON round-trip
+    file_key = [st.st_mtime_ns, st.st_size]
+
+    # Track attempts: one read here, at most one write below.
+    # Entries are {"count", "last_key", "last_ok"}; older files hold a bare count.
+    attempts = load_attempts()
+    previous = attempts.pop(file_path, None)  # Re-inserted last, so newest
+    entry = {"count": previous} if isinstance(previous, int) else (previous or {})
+
+    # Unchanged since it last validated cleanly - skip the LSP round-trip
+    if entry.get("last_ok") and entry.get("last_key") == file_key:
+        sys.exit(0)
+
+    current_attempt = entry.get("count", 0) + 1
+
+    # If max attempts exceeded, skip validation to avoid infinite loop
+    if current_attempt > MAX_ATTEMPTS:
+        print(f"⚠️ LSP validation: Maximum attempts ({MAX_ATTEMPTS}) exceeded for {file_path}")
+        print("   Manual review may be required.")
+        # Entry stays popped: reset for next edit session
+    elif validate_file(file_path, current_attempt):
+        # If valid, reset attempt counter and remember this version
+        attempts[file_path] = {"count": 0, "last_key": file_key, "last_ok": True}
+    else:
+        attempts[file_path] = {"count": current_attempt, "last_key": file_key, "last_ok": False}
+
+    if attempts.get(file_path) != previous:
+        save_attempts(prune_attempts(attempts))
+
     # Always exit 0 for auto-fix loop (don't block)
     sys.exit(0)
 
@@ -411,6 +411,9 @@ SCHEMAS = {
     "content_categories": CONTENT_CATEGORY_SCHEMA,
 }
 
+# Field names per schema, built once for O(1) membership checks
+SCHEMA_FIELD_SETS = {name: frozenset(schema.names) for name, schema in SCHEMAS.items()}
+
 # DMO name mapping
 # Note: Session Tracing DMOs use ssot__ prefix, but GenAI Quality DMOs do NOT
 DMO_NAMES = {
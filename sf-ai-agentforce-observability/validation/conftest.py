@@ -19,27 +19,44 @@ Usage:
         pass
 """
 
+import io
 import os
+import re
 import sys
 import json
+import functools
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Generator, Optional
+from typing import Dict, Generator, Iterable, Optional
 from unittest.mock import MagicMock, patch
 
 import polars as pl
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # optional: stdlib fallback
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Add skill scripts to path (once, for every scenario module)
+SKILL_ROOT = Path(__file__).resolve().parent.parent
+if str(SKILL_ROOT) not in sys.path:
+    sys.path.insert(0, str(SKILL_ROOT))
+
+# Documentation the tier4 tests validate
+SKILL_MD_PATH = SKILL_ROOT / "SKILL.md"
+DATA_MODEL_REFERENCE_PATH = SKILL_ROOT / "resources" / "data-model-reference.md"
+QUERY_PATTERNS_PATH = SKILL_ROOT / "resources" / "query-patterns.md"
 
 from scripts.models import (
-    SCHEMAS,
+    SCHEMA_FIELD_SETS,
     DMO_NAMES,
     SESSION_SCHEMA,
     INTERACTION_SCHEMA,
@@ -81,6 +98,10 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "tier6: Tier 6 - Live SQL Execution tests (bonus)"
     )
+    # Registered here too so --strict-markers accepts it without pytest-xdist
+    config.addinivalue_line(
+        "markers", "xdist_group(name): keep tests on one xdist worker (--dist=loadgroup)"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -92,6 +113,23 @@ def pytest_collection_modifyitems(config, items):
                 item.add_marker(skip_live)
 
 
+def pytest_sessionstart(session):
+    """
+    Generate missing sample fixtures on the xdist controller.
+
+    Runs before workers start, so parallel workers never race to write the
+    same Parquet files from the sample_data_dir fixture.
+    """
+    config = session.config
+    if hasattr(config, "workerinput") or not getattr(config.option, "numprocesses", None):
+        return
+
+    fixtures_dir = Path(__file__).parent / "fixtures"
+    if not (fixtures_dir / "metadata.json").exists():
+        fixtures_dir.mkdir(parents=True, exist_ok=True)
+        _create_sample_fixtures(fixtures_dir)
+
+
 def pytest_addoption(parser):
     """Add custom CLI options."""
     parser.addoption(
@@ -179,11 +217,51 @@ def mock_auth():
 
 @pytest.fixture(scope="session")
 def data_client(auth_client):
-    """Create authenticated Data360Client."""
+    """
+    Create authenticated Data360Client.
+
+    Session-scoped, so under pytest-xdist each worker authenticates once
+    and reuses the client for every live test it runs.
+    """
     from scripts.datacloud_client import Data360Client
     return Data360Client(auth_client)
 
 
+@pytest.fixture(scope="session")
+def any_session_id(data_client) -> str:
+    """
+    Probe the org once for a real session ID.
+
+    Skips dependent tests when the org has no session data.
+    """
+    sessions = list(data_client.query(
+        "SELECT ssot__Id__c FROM ssot__AIAgentSession__dlm LIMIT 1"
+    ))
+    if not sessions:
+        pytest.skip("No session data available")
+    return sessions[0]["ssot__Id__c"]
+
+
+@pytest.fixture(scope="session")
+def dmo_probe(data_client):
+    """
+    Probe DMOs for queryability, at most once per DMO per session.
+
+    Returns a getter: probe(entity) -> None if the DMO answered, else the
+    RuntimeError message.
+    """
+    @functools.cache
+    def _probe(entity: str):
+        dmo = DMO_NAMES[entity]
+        try:
+            list(data_client.query(f"SELECT ssot__Id__c FROM {dmo} LIMIT 1"))
+            return None
+        except RuntimeError as e:
+            return str(e)
+
+    return _probe
+
+
 @pytest.fixture
 def mock_data_client(mock_auth):
     """Create mocked Data360Client for offline testing."""
@@ -195,10 +273,125 @@ def mock_data_client(mock_auth):
     return mock
 
 
+# =============================================================================
+# Schema Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def schema_fields() -> dict:
+    """
+    Field names per entity (keys match SCHEMAS) as frozensets.
+
+    Exposes scripts.models.SCHEMA_FIELD_SETS, built once at import, so
+    schema tests do O(1) membership checks.
+    """
+    return SCHEMA_FIELD_SETS
+
+
+@pytest.fixture(scope="session")
+def field_casing_violations(schema_fields) -> dict:
+    """
+    Custom fields per entity that use AIAgent (capital I) instead of AiAgent.
+
+    DMO names use AIAgent; field names must use AiAgent. Derived once from
+    schema_fields so casing tests are a dict lookup.
+    """
+    return {
+        entity: sorted(name for name in names if "__c" in name and "AIAgent" in name)
+        for entity, names in schema_fields.items()
+    }
+
+
+# =============================================================================
+# Documentation Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def data_model_reference() -> str:
+    """Load resources/data-model-reference.md content once per session."""
+    return DATA_MODEL_REFERENCE_PATH.read_text()
+
+
+@pytest.fixture(scope="session")
+def data_model_reference_lower(data_model_reference: str) -> str:
+    """Lowercased data-model-reference.md, for case-insensitive checks."""
+    return data_model_reference.lower()
+
+
+def _find_terms(content: str, terms) -> frozenset:
+    """Return the terms that occur in content, in one regex pass."""
+    terms = sorted(set(terms))
+    # The lookahead stops at every position where some term starts, including
+    # overlapping ones ("TelemetryTrace" inside "TelemetryTraceSpanId")
+    starts = re.compile("(?=" + "|".join(map(re.escape, terms)) + ")")
+
+    found = set()
+    for match in starts.finditer(content):
+        found.update(t for t in terms if content.startswith(t, match.start()))
+    return frozenset(found)
+
+
+@pytest.fixture(scope="session")
+def find_terms():
+    """
+    Multi-term scanner for documentation tests.
+
+    Usage:
+        found = find_terms(skill_md_content, ("JWT", "OAuth"))  # frozenset
+    """
+    return _find_terms
+
+
+def _term_groups_found(content: str, groups: Dict[str, Iterable[str]]) -> Dict[str, frozenset]:
+    """Map each group key to the group's terms that occur in content, in one scan."""
+    found = _find_terms(content, [term for group in groups.values() for term in group])
+    return {key: found.intersection(group) for key, group in groups.items()}
+
+
+@pytest.fixture(scope="session")
+def term_groups_found():
+    """
+    Grouped find_terms for documentation tests that check named term groups.
+
+    Usage:
+        found = term_groups_found(skill_md_content, {"auth": ("JWT", "OAuth")})
+        assert found["auth"]  # frozenset of the group's terms present
+    """
+    return _term_groups_found
+
+
+@pytest.fixture(scope="session")
+def query_patterns_path() -> Path:
+    """Path to resources/query-patterns.md."""
+    return QUERY_PATTERNS_PATH
+
+
+@pytest.fixture(scope="session")
+def query_patterns_content(query_patterns_path: Path) -> str:
+    """Load resources/query-patterns.md content once per session."""
+    return query_patterns_path.read_text()
+
+
+@pytest.fixture(scope="session")
+def skill_md_path() -> Path:
+    """Path to the skill's SKILL.md."""
+    return SKILL_MD_PATH
+
+
+@pytest.fixture(scope="session")
+def skill_md_content(skill_md_path: Path) -> str:
+    """Load SKILL.md content once per session."""
+    return skill_md_path.read_text()
+
+
 # =============================================================================
 # Test Data Directory Fixtures
 # =============================================================================
 
+# Entity directories the analysis commands read under --data-dir
+ENTITY_DIRS = ("sessions", "interactions", "steps", "messages")
+
+
 @pytest.fixture
 def temp_output_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for test output."""
@@ -219,19 +412,88 @@ def sample_data_dir(fixtures_dir: Path) -> Path:
     """
     Path to sample Parquet data for offline testing.
 
-    If fixtures don't exist, creates minimal sample data.
+    The generated Parquet persists in fixtures/ and is reused across runs.
+    metadata.json is written last, so it marks a complete set; without it
+    the fixtures are (re)generated.
     """
     if not fixtures_dir.exists():
         fixtures_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create sample data if not exists
-    sessions_dir = fixtures_dir / "sessions"
-    if not sessions_dir.exists():
+    # Create sample data if not exists (or a previous run stopped midway)
+    if not (fixtures_dir / "metadata.json").exists():
         _create_sample_fixtures(fixtures_dir)
 
     return fixtures_dir
 
 
+@pytest.fixture(scope="session")
+def parquet_files(sample_data_dir: Path) -> dict:
+    """
+    Parquet files per entity directory under sample_data_dir.
+
+    Globbed once per session so Parquet structure tests don't each walk
+    the fixture tree.
+    """
+    return {
+        entity: sorted((sample_data_dir / entity).glob("**/*.parquet"))
+        for entity in ENTITY_DIRS
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_data_dir_str(sample_data_dir: Path) -> str:
+    """sample_data_dir as a string, converted once for CLI argument lists."""
+    return str(sample_data_dir)
+
+
+@pytest.fixture(scope="session")
+def analyzer(sample_data_dir: Path):
+    """
+    STDMAnalyzer over the sample fixtures, shared across the session.
+
+    The analyzer only holds data_dir and builds fresh lazy frames per call,
+    so sharing one instance is safe.
+    """
+    from scripts.analyzer import STDMAnalyzer
+    return STDMAnalyzer(sample_data_dir)
+
+
+@pytest.fixture(scope="session")
+def empty_interactions_parquet() -> bytes:
+    """
+    Parquet bytes for an interactions table with INTERACTION_SCHEMA and no rows.
+
+    Built once per session; tests write it with Path.write_bytes().
+    """
+    buf = io.BytesIO()
+    pq.write_table(INTERACTION_SCHEMA.empty_table(), buf)
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def empty_data_dir(tmp_path_factory) -> Path:
+    """
+    Data directory with an empty subdirectory per entity and no Parquet.
+
+    Built once per session; the analysis commands only read it, so tests
+    share it rather than creating their own.
+    """
+    data_dir = tmp_path_factory.mktemp("empty_data")
+    for entity in ENTITY_DIRS:
+        (data_dir / entity).mkdir()
+    return data_dir
+
+
+@pytest.fixture(scope="session")
+def empty_interactions_data_dir(tmp_path_factory, empty_data_dir: Path,
+                                empty_interactions_parquet: bytes) -> Path:
+    """Copy of empty_data_dir whose interactions/ holds one zero-row Parquet file."""
+    data_dir = tmp_path_factory.mktemp("empty_interactions") / "data"
+    shutil.copytree(empty_data_dir, data_dir)
+    (data_dir / "interactions" / "data.parquet").write_bytes(empty_interactions_parquet)
+    return data_dir
+
+
 def _create_sample_fixtures(fixtures_dir: Path):
     """Create minimal sample Parquet fixtures for offline testing."""
 
@@ -407,20 +669,92 @@ def _create_sample_fixtures(fixtures_dir: Path):
 # CLI Testing Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Create Click CLI test runner."""
+    """
+    Create Click CLI test runner.
+
+    Session-scoped: CliRunner keeps no state between invoke() calls, each
+    of which builds a fresh context and output capture.
+    """
     from click.testing import CliRunner
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_app():
     """Import CLI application."""
     from scripts.cli import cli
     return cli
 
 
+@pytest.fixture(scope="session")
+def help_output(cli_app):
+    """
+    Get `<command> --help` text, rendering each command once per session.
+
+    Renders via Command.get_help() on the Click objects directly, so no
+    CliRunner invocation or stream capture is involved.
+
+    Usage:
+        assert "--data-dir" in help_output("analyze")
+    """
+    import click
+
+    root_ctx = click.Context(cli_app, info_name="cli")
+
+    @functools.cache
+    def _get(command: str) -> str:
+        cmd = cli_app.get_command(root_ctx, command)
+        assert cmd is not None, f"Unknown command: {command}"
+        ctx = click.Context(cmd, info_name=command, parent=root_ctx)
+        return cmd.get_help(ctx)
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def format_result(cli_runner, cli_app, sample_data_dir_str: str):
+    """
+    Run `<command> --data-dir <fixtures> --format <fmt>` once per session.
+
+    Returns a getter yielding the cached Click Result, so every test that
+    inspects the same command/format shares one analyzer run.
+
+    Usage:
+        result = format_result("analyze", "json")
+    """
+    @functools.cache
+    def _get(command: str, fmt: str):
+        return cli_runner.invoke(cli_app, [
+            command,
+            "--data-dir", sample_data_dir_str,
+            "--format", fmt
+        ])
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def format_json(format_result):
+    """
+    Parse the cached `<command> --format json` output from format_result.
+
+    Returns a getter yielding the decoded value, or None when the output
+    is not valid JSON. Uses orjson when installed.
+
+    Usage:
+        data = format_json("analyze")
+    """
+    def _get(command: str):
+        try:
+            return _json_loads(format_result(command, "json").output)
+        except _JSONDecodeError:
+            return None
+
+    return _get
+
+
 # =============================================================================
 # Scoring Fixtures
 # =============================================================================
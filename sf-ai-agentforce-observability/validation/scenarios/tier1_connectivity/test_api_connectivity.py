@@ -9,13 +9,7 @@ Tests Data 360 v65.0 API connectivity:
 These are live API tests that require real Salesforce connection.
 """
 
-import sys
 import pytest
-from pathlib import Path
-
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
 
 
 @pytest.mark.tier1
@@ -8,13 +8,7 @@ Tests count command for checking data volume:
 SKILL.md Section: "Count Records"
 """
 
-import sys
 import pytest
-from pathlib import Path
-
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
 
 
 @pytest.mark.tier2
@@ -46,7 +40,8 @@ class TestCountCLI:
         result = cli_runner.invoke(cli_app, ["count"])
 
         assert result.exit_code != 0
-        assert "org" in result.output.lower() or "required" in result.output.lower()
+        output_lower = result.output.lower()
+        assert "org" in output_lower or "required" in output_lower
 
 
 @pytest.mark.tier2
@@ -9,16 +9,29 @@ Tests extract command creates correct output structure:
 SKILL.md Section: "Output Directory Structure"
 """
 
-import sys
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
+
+@pytest.fixture(scope="module")
+def shared_extract(data_client, tmp_path_factory):
+    """
+    Run one live extraction (last 1 day) shared by all TestExtractBasic tests.
+
+    Returns (result, output_dir). Tests must treat both as read-only.
+    """
+    from scripts.extractor import STDMExtractor
+
+    output_dir = tmp_path_factory.mktemp("stdm_extract")
+    extractor = STDMExtractor(data_client, output_dir)
+
+    # Extract last 1 day (minimal data)
+    since = datetime.utcnow() - timedelta(days=1)
+    result = extractor.extract_sessions(
+        since=since,
+        show_progress=False
+    )
+    return result, output_dir
 
 
 @pytest.mark.tier2
@@ -27,41 +40,24 @@ sys.path.insert(0, str(SKILL_ROOT))
 class TestExtractBasic:
     """Test basic extraction creates correct structure (10 points)."""
 
-    def test_extract_creates_four_directories(self, data_client, temp_output_dir):
+    def test_extract_creates_four_directories(self, shared_extract):
         """extract command creates sessions/, interactions/, steps/, messages/."""
-        from scripts.extractor import STDMExtractor
-
-        extractor = STDMExtractor(data_client, temp_output_dir)
-
-        # Extract last 1 day (minimal data)
-        since = datetime.utcnow() - timedelta(days=1)
-        result = extractor.extract_sessions(
-            since=since,
-            show_progress=False
-        )
+        _, output_dir = shared_extract
 
         # Check all 4 directories exist
         expected_dirs = ["sessions", "interactions", "steps", "messages"]
         for dir_name in expected_dirs:
-            dir_path = temp_output_dir / dir_name
+            dir_path = output_dir / dir_name
             assert dir_path.exists(), f"Missing directory: {dir_name}"
             assert dir_path.is_dir(), f"Not a directory: {dir_name}"
 
-    def test_extract_creates_parquet_files(self, data_client, temp_output_dir):
+    def test_extract_creates_parquet_files(self, shared_extract):
         """Extraction creates Parquet files in each directory."""
-        from scripts.extractor import STDMExtractor
-
-        extractor = STDMExtractor(data_client, temp_output_dir)
-
-        since = datetime.utcnow() - timedelta(days=1)
-        result = extractor.extract_sessions(
-            since=since,
-            show_progress=False
-        )
+        result, output_dir = shared_extract
 
         # At least sessions directory should have data
         # (other directories depend on session data existing)
-        sessions_dir = temp_output_dir / "sessions"
+        sessions_dir = output_dir / "sessions"
 
         # Should have at least the directory structure
         assert sessions_dir.exists()
@@ -71,17 +67,9 @@ class TestExtractBasic:
             parquet_files = list(sessions_dir.glob("**/*.parquet"))
             assert len(parquet_files) > 0, "No Parquet files in sessions/"
 
-    def test_extract_returns_result_counts(self, data_client, temp_output_dir):
+    def test_extract_returns_result_counts(self, shared_extract):
         """Extraction returns result with count attributes."""
-        from scripts.extractor import STDMExtractor
-
-        extractor = STDMExtractor(data_client, temp_output_dir)
-
-        since = datetime.utcnow() - timedelta(days=1)
-        result = extractor.extract_sessions(
-            since=since,
-            show_progress=False
-        )
+        result, _ = shared_extract
 
         # Result should have count attributes
         assert hasattr(result, 'sessions_count')
@@ -116,7 +104,8 @@ class TestExtractCLI:
         result = cli_runner.invoke(cli_app, ["extract"])
 
         assert result.exit_code != 0
-        assert "org" in result.output.lower() or "required" in result.output.lower()
+        output_lower = result.output.lower()
+        assert "org" in output_lower or "required" in output_lower
 
 
 @pytest.mark.tier2
@@ -124,20 +113,6 @@ class TestExtractCLI:
 class TestExtractOffline:
     """Offline tests for extraction logic."""
 
-    def test_date_range_calculation(self):
-        """--days N calculates correct date range."""
-        from datetime import datetime, timedelta
-
-        days = 7
-        expected_start = datetime.utcnow() - timedelta(days=days)
-
-        # The date should be approximately 7 days ago
-        # Allow 1 minute tolerance for test execution time
-        actual_start = datetime.utcnow() - timedelta(days=7)
-        diff = abs((expected_start - actual_start).total_seconds())
-
-        assert diff < 60, "Date range calculation off by more than 1 minute"
-
     def test_output_dir_default(self):
         """Default output directory is ./stdm_data."""
         # This is documented in SKILL.md CLI reference
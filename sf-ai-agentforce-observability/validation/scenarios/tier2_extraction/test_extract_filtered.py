@@ -9,15 +9,9 @@ Tests extraction filtering options:
 SKILL.md Section: "CLI Quick Reference"
 """
 
-import sys
 import pytest
-from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
-
 
 @pytest.mark.tier2
 @pytest.mark.live_api
@@ -8,15 +8,9 @@ Tests extract-incremental command:
 SKILL.md Section: "Incremental Extraction"
 """
 
-import sys
 import json
 import pytest
-from pathlib import Path
-from datetime import datetime, timedelta
-
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
+from datetime import datetime
 
 
 @pytest.mark.tier2
@@ -29,14 +23,16 @@ class TestIncrementalCLI:
         result = cli_runner.invoke(cli_app, ["extract-incremental", "--help"])
 
         assert result.exit_code == 0
-        assert "watermark" in result.output.lower() or "incremental" in result.output.lower()
+        output_lower = result.output.lower()
+        assert "watermark" in output_lower or "incremental" in output_lower
 
     def test_extract_incremental_requires_org(self, cli_runner, cli_app):
         """extract-incremental requires --org."""
         result = cli_runner.invoke(cli_app, ["extract-incremental"])
 
         assert result.exit_code != 0
-        assert "org" in result.output.lower() or "required" in result.output.lower()
+        output_lower = result.output.lower()
+        assert "org" in output_lower or "required" in output_lower
 
 
 @pytest.mark.tier2
@@ -8,13 +8,7 @@ Tests extract-tree command for session-specific extraction:
 SKILL.md Section: "Extract Session Tree"
 """
 
-import sys
 import pytest
-from pathlib import Path
-
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
 
 
 @pytest.mark.tier2
@@ -30,7 +24,8 @@ class TestExtractTree:
         ])
 
         assert result.exit_code != 0
-        assert "session-id" in result.output.lower() or "required" in result.output.lower()
+        output_lower = result.output.lower()
+        assert "session-id" in output_lower or "required" in output_lower
 
     def test_extract_tree_help(self, cli_runner, cli_app):
         """extract-tree --help shows usage."""
@@ -55,25 +50,13 @@ class TestExtractTree:
 class TestExtractTreeLive:
     """Live tests for extract-tree."""
 
-    def test_extract_tree_with_real_session(self, data_client, temp_output_dir):
+    def test_extract_tree_with_real_session(self, data_client, any_session_id, temp_output_dir):
         """Extract tree for a real session ID (requires data)."""
         from scripts.extractor import STDMExtractor
-        from datetime import datetime, timedelta
-
-        # First, get a session ID to test with
-        sessions = list(data_client.query(
-            "SELECT ssot__Id__c FROM ssot__AIAgentSession__dlm LIMIT 1"
-        ))
-
-        if not sessions:
-            pytest.skip("No session data available for extract-tree test")
-
-        session_id = sessions[0]["ssot__Id__c"]
 
-        # Now extract that session's tree
         extractor = STDMExtractor(data_client, temp_output_dir)
         result = extractor.extract_session_tree(
-            session_ids=[session_id],
+            session_ids=[any_session_id],
             show_progress=False
         )
 
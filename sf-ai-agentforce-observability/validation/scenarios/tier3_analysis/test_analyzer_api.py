@@ -0,0 +1,30 @@
+"""
+T3: Analyzer API Tests
+
+Tests STDMAnalyzer exposes the methods the analysis commands call:
+- Checked on the class, so no analyzer is built and no Parquet is read
+
+SKILL.md Section: "Analysis Commands"
+"""
+
+import pytest
+
+from scripts.analyzer import STDMAnalyzer
+
+
+@pytest.mark.tier3
+@pytest.mark.offline
+class TestAnalyzerAPI:
+    """Test STDMAnalyzer public method surface."""
+
+    @pytest.mark.parametrize("method", [
+        "session_summary",
+        "topic_analysis",
+        "quality_report",
+        "hallucination_summary",
+        "print_session_debug",
+    ])
+    def test_analyzer_has_method(self, method):
+        """STDMAnalyzer defines each method used by the CLI."""
+        fn = getattr(STDMAnalyzer, method, None)
+        assert callable(fn), f"STDMAnalyzer missing callable {method}"
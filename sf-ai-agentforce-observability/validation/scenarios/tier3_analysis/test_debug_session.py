@@ -8,13 +8,7 @@ Tests debug-session command for timeline reconstruction:
 SKILL.md Section: "Debug Session Timeline"
 """
 
-import sys
 import pytest
-from pathlib import Path
-
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
 
 
 @pytest.mark.tier3
@@ -22,14 +16,14 @@ sys.path.insert(0, str(SKILL_ROOT))
 class TestDebugSessionCLI:
     """Test debug-session command CLI."""
 
-    def test_debug_session_help(self, cli_runner, cli_app):
+    def test_debug_session_help(self, help_output):
         """debug-session --help shows usage."""
-        result = cli_runner.invoke(cli_app, ["debug-session", "--help"])
+        output = help_output("debug-session")
 
-        assert result.exit_code == 0
-        assert "timeline" in result.output.lower() or "session" in result.output.lower()
-        assert "--session-id" in result.output
-        assert "--data-dir" in result.output
+        output_lower = output.lower()
+        assert "timeline" in output_lower or "session" in output_lower
+        assert "--session-id" in output
+        assert "--data-dir" in output
 
     def test_debug_session_requires_data_dir(self, cli_runner, cli_app):
         """debug-session requires --data-dir."""
@@ -39,17 +33,19 @@ class TestDebugSessionCLI:
         ])
 
         assert result.exit_code != 0
-        assert "data-dir" in result.output.lower() or "required" in result.output.lower()
+        output_lower = result.output.lower()
+        assert "data-dir" in output_lower or "required" in output_lower
 
-    def test_debug_session_requires_session_id(self, cli_runner, cli_app, sample_data_dir):
+    def test_debug_session_requires_session_id(self, cli_runner, cli_app, sample_data_dir_str):
         """debug-session requires --session-id."""
         result = cli_runner.invoke(cli_app, [
             "debug-session",
-            "--data-dir", str(sample_data_dir)
+            "--data-dir", sample_data_dir_str
         ])
 
         assert result.exit_code != 0
-        assert "session-id" in result.output.lower() or "required" in result.output.lower()
+        output_lower = result.output.lower()
+        assert "session-id" in output_lower or "required" in output_lower
 
 
 @pytest.mark.tier3
@@ -57,14 +53,14 @@ class TestDebugSessionCLI:
 class TestDebugSessionWithFixtures:
     """Test debug-session with fixture data."""
 
-    def test_debug_session_shows_timeline(self, cli_runner, cli_app, sample_data_dir):
+    def test_debug_session_shows_timeline(self, cli_runner, cli_app, sample_data_dir_str):
         """debug-session shows timeline for existing session."""
         # Use session ID from fixture data
         session_id = "session-001"
 
         result = cli_runner.invoke(cli_app, [
             "debug-session",
-            "--data-dir", str(sample_data_dir),
+            "--data-dir", sample_data_dir_str,
             "--session-id", session_id
         ])
 
@@ -74,29 +70,18 @@ class TestDebugSessionWithFixtures:
             # Output should contain timeline information
             assert len(result.output) > 0
 
-    def test_debug_session_nonexistent_session(self, cli_runner, cli_app, sample_data_dir):
-        """debug-session handles non-existent session gracefully."""
-        result = cli_runner.invoke(cli_app, [
-            "debug-session",
-            "--data-dir", str(sample_data_dir),
-            "--session-id", "nonexistent-session-xyz"
-        ])
-
-        # Should either succeed with "not found" message or fail gracefully
-        # Either way, shouldn't crash
-        assert result.exception is None or "not found" in str(result.exception).lower()
-
 
 @pytest.mark.tier3
 @pytest.mark.offline
 class TestDebugSessionAnalyzer:
     """Test debug session functionality in analyzer."""
 
-    def test_print_session_debug_method_exists(self, sample_data_dir):
-        """STDMAnalyzer has print_session_debug method."""
-        from scripts.analyzer import STDMAnalyzer
-
-        analyzer = STDMAnalyzer(sample_data_dir)
-
-        assert hasattr(analyzer, 'print_session_debug')
-        assert callable(analyzer.print_session_debug)
+    def test_debug_session_nonexistent_session(self, analyzer):
+        """print_session_debug() handles non-existent session gracefully."""
+        # Called in-process on the shared analyzer; the CLI wiring is
+        # covered by test_debug_session_shows_timeline.
+        # Should either print a "not found" message or fail gracefully
+        try:
+            analyzer.print_session_debug("nonexistent-session-xyz")
+        except Exception as e:
+            assert "not found" in str(e).lower()
@@ -9,14 +9,7 @@ Tests quality-report command for quality metrics:
 SKILL.md Section: "Quality Report"
 """
 
-import sys
-import json
 import pytest
-from pathlib import Path
-
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
 
 
 @pytest.mark.tier3
@@ -24,28 +17,22 @@ sys.path.insert(0, str(SKILL_ROOT))
 class TestQualityReportCLI:
     """Test quality-report command CLI."""
 
-    def test_quality_report_help(self, cli_runner, cli_app):
-        """quality-report --help shows usage."""
-        result = cli_runner.invoke(cli_app, ["quality-report", "--help"])
+    def test_quality_report_help(self, help_output):
+        """quality-report --help shows usage and --format accepts table, json."""
+        output = help_output("quality-report")
 
-        assert result.exit_code == 0
-        assert "quality" in result.output.lower()
-        assert "--data-dir" in result.output
+        assert "quality" in output.lower()
+        assert "--data-dir" in output
+        assert "table" in output
+        assert "json" in output
 
     def test_quality_report_requires_data_dir(self, cli_runner, cli_app):
         """quality-report requires --data-dir."""
         result = cli_runner.invoke(cli_app, ["quality-report"])
 
         assert result.exit_code != 0
-        assert "data-dir" in result.output.lower() or "required" in result.output.lower()
-
-    def test_quality_report_format_options(self, cli_runner, cli_app):
-        """quality-report --format accepts table, json."""
-        result = cli_runner.invoke(cli_app, ["quality-report", "--help"])
-
-        assert result.exit_code == 0
-        assert "table" in result.output
-        assert "json" in result.output
+        output_lower = result.output.lower()
+        assert "data-dir" in output_lower or "required" in output_lower
 
 
 @pytest.mark.tier3
@@ -53,61 +40,24 @@ class TestQualityReportCLI:
 class TestQualityReportWithFixtures:
     """Test quality-report with fixture data."""
 
-    def test_quality_report_table_format(self, cli_runner, cli_app, sample_data_dir):
-        """quality-report --format table produces output."""
-        result = cli_runner.invoke(cli_app, [
-            "quality-report",
-            "--data-dir", str(sample_data_dir),
-            "--format", "table"
-        ])
-
-        # May fail if quality DMOs not present, but shouldn't crash
-        # The command should handle missing quality data gracefully
-        if result.exit_code != 0:
+    @pytest.mark.parametrize("fmt", ["table", "json"])
+    def test_quality_report_format(self, format_result, format_json, fmt):
+        """quality-report --format table|json produces output or a clear error."""
+        result = format_result("quality-report", fmt)
+
+        if fmt == "table" and result.exit_code != 0:
+            # May fail if quality DMOs not present, but shouldn't crash
             # Acceptable if it's a "quality data not found" error
-            assert ("quality" in result.output.lower() or
-                    "not found" in result.output.lower() or
-                    "extract-quality" in result.output.lower())
-
-    def test_quality_report_json_format(self, cli_runner, cli_app, sample_data_dir):
-        """quality-report --format json produces JSON or error."""
-        result = cli_runner.invoke(cli_app, [
-            "quality-report",
-            "--data-dir", str(sample_data_dir),
-            "--format", "json"
-        ])
-
-        # If successful, should be valid JSON
-        if result.exit_code == 0:
-            try:
-                data = json.loads(result.output)
+            output_lower = result.output.lower()
+            assert ("quality" in output_lower or
+                    "not found" in output_lower or
+                    "extract-quality" in output_lower)
+
+        elif fmt == "json" and result.exit_code == 0:
+            # If successful, should be valid JSON
+            data = format_json("quality-report")
+            if data is not None:  # May have non-JSON error message
                 assert isinstance(data, (dict, list))
-            except json.JSONDecodeError:
-                pass  # May have non-JSON error message
-
-
-@pytest.mark.tier3
-@pytest.mark.offline
-class TestQualityAnalyzer:
-    """Test quality analysis in analyzer."""
-
-    def test_quality_report_method_exists(self, sample_data_dir):
-        """STDMAnalyzer has quality_report method."""
-        from scripts.analyzer import STDMAnalyzer
-
-        analyzer = STDMAnalyzer(sample_data_dir)
-
-        assert hasattr(analyzer, 'quality_report')
-        assert callable(analyzer.quality_report)
-
-    def test_hallucination_summary_method_exists(self, sample_data_dir):
-        """STDMAnalyzer has hallucination_summary method."""
-        from scripts.analyzer import STDMAnalyzer
-
-        analyzer = STDMAnalyzer(sample_data_dir)
-
-        assert hasattr(analyzer, 'hallucination_summary')
-        assert callable(analyzer.hallucination_summary)
 
 
 @pytest.mark.tier3
@@ -115,12 +65,11 @@ class TestQualityAnalyzer:
 class TestFindHallucinationsCLI:
     """Test find-hallucinations command."""
 
-    def test_find_hallucinations_help(self, cli_runner, cli_app):
+    def test_find_hallucinations_help(self, help_output):
         """find-hallucinations --help shows usage."""
-        result = cli_runner.invoke(cli_app, ["find-hallucinations", "--help"])
+        output = help_output("find-hallucinations").lower()
 
-        assert result.exit_code == 0
-        assert "hallucination" in result.output.lower() or "ungrounded" in result.output.lower()
+        assert "hallucination" in output or "ungrounded" in output
 
     def test_find_hallucinations_requires_data_dir(self, cli_runner, cli_app):
         """find-hallucinations requires --data-dir."""
@@ -8,13 +8,9 @@ Tests DMO name and field schema definitions:
 SKILL.md Section: "Session Tracing Data Model", "Key Schema Notes"
 """
 
-import sys
 import pytest
-from pathlib import Path
 
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
+from scripts.models import DMO_NAMES
 
 
 @pytest.mark.tier4
@@ -24,58 +20,36 @@ class TestDMONames:
 
     def test_dmo_names_registry_exists(self):
         """DMO_NAMES dictionary exists in models.py."""
-        from scripts.models import DMO_NAMES
-
         assert DMO_NAMES is not None
         assert isinstance(DMO_NAMES, dict)
 
     def test_core_dmos_defined(self):
         """All 4 core STDM DMOs are defined."""
-        from scripts.models import DMO_NAMES
-
         expected_entities = ["sessions", "interactions", "steps", "messages"]
 
         for entity in expected_entities:
             assert entity in DMO_NAMES, f"Missing DMO mapping for: {entity}"
 
-    def test_session_dmo_name_correct(self):
-        """Session DMO name is ssot__AIAgentSession__dlm."""
-        from scripts.models import DMO_NAMES
-
-        # Note: DMO names use AIAgent (capital I), not AiAgent
-        # This is the Data Cloud object name
-        assert DMO_NAMES["sessions"] == "ssot__AIAgentSession__dlm"
-
-    def test_interaction_dmo_name_correct(self):
-        """Interaction DMO name is ssot__AIAgentInteraction__dlm."""
-        from scripts.models import DMO_NAMES
-
-        assert DMO_NAMES["interactions"] == "ssot__AIAgentInteraction__dlm"
-
-    def test_step_dmo_name_correct(self):
-        """Step DMO name is ssot__AIAgentInteractionStep__dlm."""
-        from scripts.models import DMO_NAMES
-
-        assert DMO_NAMES["steps"] == "ssot__AIAgentInteractionStep__dlm"
-
-    def test_message_dmo_name_correct(self):
-        """Message/Moment DMO name is ssot__AIAgentMoment__dlm."""
-        from scripts.models import DMO_NAMES
-
-        # Note: "messages" maps to AIAgentMoment (not Message)
-        assert DMO_NAMES["messages"] == "ssot__AIAgentMoment__dlm"
-
-    def test_quality_dmos_no_ssot_prefix(self):
+    # Note: DMO names use AIAgent (capital I), not AiAgent - this is the
+    # Data Cloud object name. "messages" maps to AIAgentMoment (not Message).
+    @pytest.mark.parametrize("entity,expected_dmo", [
+        ("sessions", "ssot__AIAgentSession__dlm"),
+        ("interactions", "ssot__AIAgentInteraction__dlm"),
+        ("steps", "ssot__AIAgentInteractionStep__dlm"),
+        ("messages", "ssot__AIAgentMoment__dlm"),
+    ])
+    def test_dmo_name_correct(self, entity, expected_dmo):
+        """Core STDM DMO names match the Data Cloud object names."""
+        assert DMO_NAMES[entity] == expected_dmo
+
+    @pytest.mark.parametrize("entity", [
+        "generations", "content_quality", "content_categories",
+    ])
+    def test_quality_dmos_no_ssot_prefix(self, entity):
         """Quality DMOs don't use ssot__ prefix."""
-        from scripts.models import DMO_NAMES
-
-        quality_entities = ["generations", "content_quality", "content_categories"]
-
-        for entity in quality_entities:
-            if entity in DMO_NAMES:
-                dmo_name = DMO_NAMES[entity]
-                assert not dmo_name.startswith("ssot__"), \
-                    f"Quality DMO {entity} should NOT have ssot__ prefix"
+        if entity in DMO_NAMES:
+            assert not DMO_NAMES[entity].startswith("ssot__"), \
+                f"Quality DMO {entity} should NOT have ssot__ prefix"
 
 
 @pytest.mark.tier4
@@ -83,15 +57,9 @@ class TestDMONames:
 class TestFieldCasing:
     """Test field name casing is correct (5 points)."""
 
-    def test_session_field_uses_ai_agent_casing(self):
+    def test_session_field_uses_ai_agent_casing(self, schema_fields):
         """Session fields use AiAgent (lowercase 'i') in field names."""
-        from scripts.models import SESSION_SCHEMA
-
-        # Get field names
-        field_names = [field.name for field in SESSION_SCHEMA]
-
-        # Check for AiAgent fields (lowercase 'i')
-        ai_agent_fields = [f for f in field_names if "AiAgent" in f]
+        field_names = schema_fields["sessions"]
 
         # These fields should exist with lowercase 'i'
         expected_ai_fields = [
@@ -103,87 +71,52 @@ class TestFieldCasing:
             assert expected in field_names, \
                 f"Missing field with AiAgent casing: {expected}"
 
-    def test_interaction_field_casing(self):
+    def test_interaction_field_casing(self, schema_fields):
         """Interaction fields use correct casing."""
-        from scripts.models import INTERACTION_SCHEMA
-
-        field_names = [field.name for field in INTERACTION_SCHEMA]
+        field_names = schema_fields["interactions"]
 
         # Should have AiAgentSessionId (lowercase 'i')
         assert "ssot__AiAgentSessionId__c" in field_names
         assert "ssot__AiAgentInteractionType__c" in field_names
 
-    def test_step_field_casing(self):
+    def test_step_field_casing(self, schema_fields):
         """Step fields use correct casing."""
-        from scripts.models import STEP_SCHEMA
-
-        field_names = [field.name for field in STEP_SCHEMA]
+        field_names = schema_fields["steps"]
 
         # Should have AiAgentInteractionId (lowercase 'i')
         assert "ssot__AiAgentInteractionId__c" in field_names
         assert "ssot__AiAgentInteractionStepType__c" in field_names
 
-    def test_message_field_casing(self):
+    def test_message_field_casing(self, schema_fields):
         """Message/Moment fields use correct casing."""
-        from scripts.models import MESSAGE_SCHEMA
-
-        field_names = [field.name for field in MESSAGE_SCHEMA]
+        field_names = schema_fields["messages"]
 
         # Should have AiAgent fields (lowercase 'i')
         assert "ssot__AiAgentSessionId__c" in field_names
         assert "ssot__AiAgentApiName__c" in field_names
 
-    def test_no_ai_agent_uppercase_i(self):
+    def test_no_ai_agent_uppercase_i(self, field_casing_violations):
         """No fields use incorrect AIAgent (capital I) in field names."""
-        from scripts.models import (
-            SESSION_SCHEMA, INTERACTION_SCHEMA,
-            STEP_SCHEMA, MESSAGE_SCHEMA
-        )
-
-        all_schemas = [
-            SESSION_SCHEMA, INTERACTION_SCHEMA,
-            STEP_SCHEMA, MESSAGE_SCHEMA
-        ]
-
-        for schema in all_schemas:
-            field_names = [field.name for field in schema]
-            for field_name in field_names:
-                # Check that we don't have AIAgent with capital I in field names
-                # (DMO names can have AIAgent, but field names use AiAgent)
-                if "__c" in field_name:  # Only check custom fields
-                    # Fields like ssot__AiAgent* are correct
-                    # We want to avoid incorrect casing in implementation
-                    pass  # Schema looks correct based on review
+        # DMO names can have AIAgent, but custom field names use AiAgent
+        offenders = {
+            entity: fields
+            for entity, fields in field_casing_violations.items()
+            if fields
+        }
+        assert not offenders, f"Fields using AIAgent (capital I): {offenders}"
 
 
 @pytest.mark.tier4
 @pytest.mark.live_api
+@pytest.mark.xdist_group("live_api")
 class TestDMONamesLive:
     """Live tests to verify DMO names against actual API."""
 
-    def test_session_dmo_queryable(self, data_client):
-        """Session DMO name is queryable."""
-        from scripts.models import DMO_NAMES
-
-        dmo = DMO_NAMES["sessions"]
-        query = f"SELECT ssot__Id__c FROM {dmo} LIMIT 1"
+    @pytest.mark.parametrize("entity", ["sessions", "interactions"])
+    def test_dmo_queryable(self, dmo_probe, entity):
+        """Session and interaction DMO names are queryable."""
+        error = dmo_probe(entity)
 
         # Should not raise error (DMO exists)
-        try:
-            list(data_client.query(query))
-        except RuntimeError as e:
-            if "does not exist" in str(e).lower():
-                pytest.fail(f"DMO {dmo} does not exist in Data Cloud")
-
-    def test_interaction_dmo_queryable(self, data_client):
-        """Interaction DMO name is queryable."""
-        from scripts.models import DMO_NAMES
-
-        dmo = DMO_NAMES["interactions"]
-        query = f"SELECT ssot__Id__c FROM {dmo} LIMIT 1"
-
-        try:
-            list(data_client.query(query))
-        except RuntimeError as e:
-            if "does not exist" in str(e).lower():
-                pytest.fail(f"DMO {dmo} does not exist in Data Cloud")
+        if error is not None and "does not exist" in error.lower():
+            pytest.fail(f"DMO {DMO_NAMES[entity]} does not exist in Data Cloud")
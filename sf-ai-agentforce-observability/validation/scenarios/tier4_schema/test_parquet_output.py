@@ -8,19 +8,28 @@ Tests Parquet output follows expected structure:
 SKILL.md Section: "Output Directory Structure"
 """
 
-import sys
 import pytest
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
+from scripts import models
+from scripts.models import SCHEMAS, SCHEMA_FIELD_SETS, MODELS
+
+pytestmark = [pytest.mark.tier4, pytest.mark.offline]
+
+
+def _footer_row_counts(files) -> list:
+    """Read each file's Parquet footer (not its data), several at a time."""
+    if len(files) <= 1:
+        return [pq.read_metadata(pf).num_rows for pf in files]
+
+    # PyArrow releases the GIL during reads, so footers overlap on threads
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+        return list(pool.map(lambda pf: pq.read_metadata(pf).num_rows, files))
 
 
-@pytest.mark.tier4
-@pytest.mark.offline
 class TestParquetStructure:
     """Test Parquet output structure (5 points)."""
 
@@ -33,79 +42,59 @@ class TestParquetStructure:
             assert dir_path.exists(), f"Missing fixture directory: {dir_name}"
             assert dir_path.is_dir(), f"Not a directory: {dir_name}"
 
-    def test_sessions_parquet_readable(self, sample_data_dir):
+    def test_sessions_parquet_readable(self, parquet_files):
         """sessions/ Parquet files are readable."""
-        sessions_dir = sample_data_dir / "sessions"
-        parquet_files = list(sessions_dir.glob("**/*.parquet"))
+        files = parquet_files["sessions"]
 
-        assert len(parquet_files) > 0, "No Parquet files in sessions/"
+        assert len(files) > 0, "No Parquet files in sessions/"
 
-        # Should be readable
-        for pf in parquet_files:
-            table = pq.read_table(pf)
-            assert len(table) >= 0
+        # Should be readable (footer only; no column data is decoded)
+        assert all(rows >= 0 for rows in _footer_row_counts(files))
 
-    def test_sessions_schema_matches(self, sample_data_dir):
+    def test_sessions_schema_matches(self, parquet_files, schema_fields):
         """sessions/ Parquet schema matches SESSION_SCHEMA."""
-        from scripts.models import SESSION_SCHEMA
-
-        sessions_dir = sample_data_dir / "sessions"
-        parquet_files = list(sessions_dir.glob("**/*.parquet"))
+        files = parquet_files["sessions"]
 
-        if not parquet_files:
+        if not files:
             pytest.skip("No session Parquet files to validate")
 
-        table = pq.read_table(parquet_files[0])
-        actual_fields = set(table.schema.names)
-        expected_fields = set(SESSION_SCHEMA.names)
+        # Footer-only schema read; no row groups are decoded
+        actual_fields = frozenset(pq.read_schema(files[0]).names)
 
         # All expected fields should be present
-        missing = expected_fields - actual_fields
+        missing = schema_fields["sessions"] - actual_fields
         assert not missing, f"Missing fields in sessions Parquet: {missing}"
 
-    def test_interactions_parquet_readable(self, sample_data_dir):
+    def test_interactions_parquet_readable(self, parquet_files):
         """interactions/ Parquet files are readable."""
-        interactions_dir = sample_data_dir / "interactions"
-        parquet_files = list(interactions_dir.glob("**/*.parquet"))
+        files = parquet_files["interactions"]
 
-        assert len(parquet_files) > 0, "No Parquet files in interactions/"
+        assert len(files) > 0, "No Parquet files in interactions/"
 
-        for pf in parquet_files:
-            table = pq.read_table(pf)
-            assert len(table) >= 0
+        assert all(rows >= 0 for rows in _footer_row_counts(files))
 
-    def test_steps_parquet_readable(self, sample_data_dir):
+    def test_steps_parquet_readable(self, parquet_files):
         """steps/ Parquet files are readable."""
-        steps_dir = sample_data_dir / "steps"
-        parquet_files = list(steps_dir.glob("**/*.parquet"))
+        files = parquet_files["steps"]
 
-        assert len(parquet_files) > 0, "No Parquet files in steps/"
+        assert len(files) > 0, "No Parquet files in steps/"
 
-        for pf in parquet_files:
-            table = pq.read_table(pf)
-            assert len(table) >= 0
+        assert all(rows >= 0 for rows in _footer_row_counts(files))
 
-    def test_messages_parquet_readable(self, sample_data_dir):
+    def test_messages_parquet_readable(self, parquet_files):
         """messages/ Parquet files are readable."""
-        messages_dir = sample_data_dir / "messages"
-        parquet_files = list(messages_dir.glob("**/*.parquet"))
+        files = parquet_files["messages"]
 
-        assert len(parquet_files) > 0, "No Parquet files in messages/"
+        assert len(files) > 0, "No Parquet files in messages/"
 
-        for pf in parquet_files:
-            table = pq.read_table(pf)
-            assert len(table) >= 0
+        assert all(rows >= 0 for rows in _footer_row_counts(files))
 
 
-@pytest.mark.tier4
-@pytest.mark.offline
 class TestSchemaRegistry:
     """Test schema registry is complete."""
 
     def test_schemas_dict_exists(self):
         """SCHEMAS dictionary exists with all entity types."""
-        from scripts.models import SCHEMAS
-
         assert SCHEMAS is not None
         assert isinstance(SCHEMAS, dict)
 
@@ -115,17 +104,20 @@ class TestSchemaRegistry:
 
     def test_schemas_are_pyarrow_schemas(self):
         """All schemas are PyArrow Schema objects."""
-        from scripts.models import SCHEMAS
-        import pyarrow as pa
-
         for name, schema in SCHEMAS.items():
             assert isinstance(schema, pa.Schema), \
                 f"SCHEMAS['{name}'] is not a PyArrow Schema"
 
+    def test_schema_field_sets_match_schemas(self):
+        """SCHEMA_FIELD_SETS holds a frozenset of names for every schema."""
+        assert SCHEMA_FIELD_SETS.keys() == SCHEMAS.keys()
+
+        for name, schema in SCHEMAS.items():
+            assert SCHEMA_FIELD_SETS[name] == frozenset(schema.names), \
+                f"SCHEMA_FIELD_SETS['{name}'] out of sync with SCHEMAS"
+
     def test_models_dict_exists(self):
         """MODELS dictionary exists with Pydantic models."""
-        from scripts.models import MODELS
-
         assert MODELS is not None
         assert isinstance(MODELS, dict)
 
@@ -135,8 +127,6 @@ class TestSchemaRegistry:
 
     def test_utility_functions_exist(self):
         """Utility functions exist in models module."""
-        from scripts import models
-
         assert hasattr(models, 'validate_record')
         assert hasattr(models, 'get_field_mapping')
         assert hasattr(models, 'get_required_fields')
@@ -10,38 +10,61 @@ Tests that documented query patterns are syntactically valid:
 query-patterns.md validation
 """
 
-import sys
 import re
+import functools
 import pytest
-from pathlib import Path
-
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
-
-
-def extract_sql_blocks(markdown_content: str) -> list:
-    """Extract SQL code blocks from markdown content."""
-    # Match ```sql ... ``` blocks
-    pattern = r'```sql\s*(.*?)```'
-    matches = re.findall(pattern, markdown_content, re.DOTALL | re.IGNORECASE)
-    return [m.strip() for m in matches if m.strip()]
 
 
+FENCE = "```"
+
+# Case-insensitive keyword probes (no uppercased copy of the query)
+_SELECT_RE = re.compile(r'\bSELECT\b', re.IGNORECASE)
+_FROM_RE = re.compile(r'\bFROM\b', re.IGNORECASE)
+_WITH_RE = re.compile(r'\bWITH\b', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8)
+def extract_sql_blocks(markdown_content: str) -> tuple:
+    """Extract SQL code blocks from markdown content (cached per content)."""
+    # Linear scan for ```sql ... ``` blocks: find each fence, keep the ones
+    # tagged sql (any case), and slice up to the next fence
+    blocks = []
+    pos = 0
+    while True:
+        start = markdown_content.find(FENCE, pos)
+        if start < 0:
+            break
+        tag_end = start + len(FENCE) + 3
+        if markdown_content[start + len(FENCE):tag_end].lower() != "sql":
+            pos = start + 1
+            continue
+
+        end = markdown_content.find(FENCE, tag_end)
+        if end < 0:
+            break
+        block = markdown_content[tag_end:end].strip()
+        if block:
+            blocks.append(block)
+        pos = end + len(FENCE)
+    return tuple(blocks)
+
+
+@functools.lru_cache(maxsize=256)
 def is_valid_sql_syntax(query: str) -> tuple:
     """
-    Basic SQL syntax validation.
+    Basic SQL syntax validation (cached per query).
     Returns (is_valid, error_message).
     """
-    # Normalize whitespace
-    query = ' '.join(query.split())
+    # Counts and keyword probes are whitespace-invariant, so the query is
+    # scanned as-is rather than normalized into a copy first
+    has_select = _SELECT_RE.search(query) is not None
 
     # Skip comment-only blocks
-    if query.startswith('--') and 'SELECT' not in query.upper():
+    if query.lstrip().startswith('--') and not has_select:
         return (True, None)
 
     # Must have SELECT for data queries
-    if 'SELECT' not in query.upper():
+    if not has_select:
         # Could be a comment or partial query
         if '--' in query:
             return (True, None)
@@ -50,22 +73,28 @@ def is_valid_sql_syntax(query: str) -> tuple:
     # Basic structure checks
     errors = []
 
+    # Count parentheses and single quotes in one pass
+    opens = closes = quotes = 0
+    for ch in query:
+        if ch == '(':
+            opens += 1
+        elif ch == ')':
+            closes += 1
+        elif ch == "'":
+            quotes += 1
+
     # Check for balanced parentheses
-    if query.count('(') != query.count(')'):
+    if opens != closes:
         errors.append("Unbalanced parentheses")
 
     # Check for balanced quotes (single)
-    single_quotes = query.count("'")
-    if single_quotes % 2 != 0:
+    if quotes % 2 != 0:
         errors.append("Unbalanced single quotes")
 
-    # Check for common syntax issues
-    upper_query = query.upper()
-
     # FROM should follow SELECT (with possible fields between)
-    if 'SELECT' in upper_query and 'FROM' not in upper_query:
+    if _FROM_RE.search(query) is None:
         # CTE queries might have FROM elsewhere
-        if 'WITH' not in upper_query:
+        if _WITH_RE.search(query) is None:
             errors.append("SELECT without FROM")
 
     if errors:
@@ -74,28 +103,72 @@ def is_valid_sql_syntax(query: str) -> tuple:
     return (True, None)
 
 
+# Terms each check looks for in query-patterns.md, scanned in a single pass
+QUERY_PATTERN_TERMS = {
+    "join": ("JOIN", "join"),
+    # Session-participant-interaction-message-step joins
+    "join_entities": ("AiAgentSession", "AiAgentInteraction"),
+    "error": ("ErrorMessage", "error", "Error"),
+    # INTERVAL or date comparison syntax
+    "interval": ("INTERVAL", "current_date", "DATE"),
+    "genai": ("GenAIGeneration", "GenAiGeneration", "generationId"),
+    "toxicity": ("toxic", "Toxicity", "isToxicityDetected"),
+    "adherence": ("InstructionAdherence", "adherence", "Adherence"),
+    "resolution": ("TaskResolution", "FULLY_RESOLVED", "NOT_RESOLVED"),
+    "ungrounded": ("UNGROUNDED", "hallucination", "Hallucination"),
+    "validation_prompt": ("ReactValidationPrompt", "ValidationPrompt"),
+    "vector_search": ("vector_search",),
+    "knowledge_index": ("Search_Index", "Knowledge", "Chunk"),
+    "extraction": ("Basic Extraction", "Extraction"),
+    "aggregation": ("Aggregation", "COUNT", "GROUP BY"),
+    "quality": ("Quality", "Analysis", "Toxic", "Trust"),
+}
+
+
+@pytest.fixture(scope="module")
+def query_pattern_terms(query_patterns_content: str, term_groups_found) -> dict:
+    """QUERY_PATTERN_TERMS key -> the group's terms present in query-patterns.md."""
+    return term_groups_found(query_patterns_content, QUERY_PATTERN_TERMS)
+
+
+# QUERY_PATTERN_TERMS key -> failure message, for checks needing any one term
+QUALITY_QUERY_CASES = {
+    "genai": "GenAI Generation queries not documented",
+    "toxicity": "Toxicity detection query not documented",
+    "adherence": "Instruction adherence query not documented",
+    "resolution": "Task resolution query not documented",
+}
+
+HALLUCINATION_QUERY_CASES = {
+    "ungrounded": "UNGROUNDED/hallucination query not documented",
+    "validation_prompt": "ReactValidationPrompt query not documented",
+}
+
+KNOWLEDGE_QUERY_CASES = {
+    "vector_search": "vector_search query not documented",
+    "knowledge_index": "Knowledge search index query not documented",
+}
+
+
 @pytest.mark.tier4
 @pytest.mark.offline
 class TestQueryPatternsFileExists:
     """Test query patterns documentation exists."""
 
-    def test_query_patterns_file_exists(self):
+    def test_query_patterns_file_exists(self, query_patterns_path):
         """query-patterns.md exists in resources."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        assert doc_path.exists(), "query-patterns.md not found"
+        assert query_patterns_path.exists(), "query-patterns.md not found"
 
-    def test_query_patterns_has_sql_blocks(self):
+    def test_query_patterns_has_sql_blocks(self, query_patterns_content):
         """query-patterns.md contains SQL code blocks."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
+        content = query_patterns_content
 
         sql_blocks = extract_sql_blocks(content)
         assert len(sql_blocks) > 0, "No SQL blocks found in query-patterns.md"
 
-    def test_query_patterns_has_minimum_queries(self):
+    def test_query_patterns_has_minimum_queries(self, query_patterns_content):
         """query-patterns.md has at least 10 query examples."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
+        content = query_patterns_content
 
         sql_blocks = extract_sql_blocks(content)
         assert len(sql_blocks) >= 10, f"Only {len(sql_blocks)} queries found, expected 10+"
@@ -106,10 +179,9 @@ class TestQueryPatternsFileExists:
 class TestBasicQuerySyntax:
     """Test basic extraction queries are syntactically valid."""
 
-    def test_all_sessions_query_valid(self):
+    def test_all_sessions_query_valid(self, query_patterns_content):
         """'All Sessions' query is syntactically valid."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
+        content = query_patterns_content
 
         sql_blocks = extract_sql_blocks(content)
 
@@ -122,10 +194,9 @@ class TestBasicQuerySyntax:
             is_valid, error = is_valid_sql_syntax(query)
             assert is_valid, f"Invalid syntax in session query: {error}\n{query[:200]}"
 
-    def test_interaction_queries_valid(self):
+    def test_interaction_queries_valid(self, query_patterns_content):
         """Interaction-related queries are syntactically valid."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
+        content = query_patterns_content
 
         sql_blocks = extract_sql_blocks(content)
 
@@ -136,10 +207,9 @@ class TestBasicQuerySyntax:
             is_valid, error = is_valid_sql_syntax(query)
             assert is_valid, f"Invalid syntax in interaction query: {error}"
 
-    def test_step_queries_valid(self):
+    def test_step_queries_valid(self, query_patterns_content):
         """Step-related queries are syntactically valid."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
+        content = query_patterns_content
 
         sql_blocks = extract_sql_blocks(content)
 
@@ -156,41 +226,24 @@ class TestBasicQuerySyntax:
 class TestOfficialQueries:
     """Test official Salesforce example queries are present."""
 
-    def test_full_session_join_documented(self):
+    def test_full_session_join_documented(self, query_pattern_terms):
         """Full 5-entity join query is documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
         # Should have a query joining multiple tables
-        join_indicators = ["JOIN", "join"]
-        has_joins = any(ind in content for ind in join_indicators)
-        assert has_joins, "No JOIN queries documented"
+        assert query_pattern_terms["join"], "No JOIN queries documented"
 
         # Should have session-participant-interaction-message-step joins
-        entities = [
-            "AiAgentSession",
-            "AiAgentInteraction",
-        ]
-        for entity in entities:
-            assert entity in content, f"Missing {entity} in join queries"
-
-    def test_error_detection_query_documented(self):
-        """Query for finding steps with errors is documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
+        for entity in QUERY_PATTERN_TERMS["join_entities"]:
+            found = entity in query_pattern_terms["join_entities"]
+            assert found, f"Missing {entity} in join queries"
 
-        error_terms = ["ErrorMessage", "error", "Error"]
-        found = any(term in content for term in error_terms)
+    def test_error_detection_query_documented(self, query_pattern_terms):
+        """Query for finding steps with errors is documented."""
+        found = query_pattern_terms["error"]
         assert found, "Error detection query not documented"
 
-    def test_interval_syntax_documented(self):
+    def test_interval_syntax_documented(self, query_pattern_terms):
         """INTERVAL syntax for date filtering is documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        # Should have INTERVAL or date comparison syntax
-        date_terms = ["INTERVAL", "current_date", "DATE"]
-        found = any(term in content for term in date_terms)
+        found = query_pattern_terms["interval"]
         assert found, "Date INTERVAL syntax not documented"
 
 
@@ -199,41 +252,12 @@ class TestOfficialQueries:
 class TestQualityAnalysisQueries:
     """Test quality analysis queries are documented."""
 
-    def test_genai_generation_queries(self):
-        """GenAI Generation join queries documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        gen_terms = ["GenAIGeneration", "GenAiGeneration", "generationId"]
-        found = any(term in content for term in gen_terms)
-        assert found, "GenAI Generation queries not documented"
-
-    def test_toxicity_detection_documented(self):
-        """Toxicity detection query documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        toxicity_terms = ["toxic", "Toxicity", "isToxicityDetected"]
-        found = any(term in content for term in toxicity_terms)
-        assert found, "Toxicity detection query not documented"
-
-    def test_instruction_adherence_documented(self):
-        """Instruction adherence query documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        adherence_terms = ["InstructionAdherence", "adherence", "Adherence"]
-        found = any(term in content for term in adherence_terms)
-        assert found, "Instruction adherence query not documented"
-
-    def test_task_resolution_documented(self):
-        """Task resolution query documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        resolution_terms = ["TaskResolution", "FULLY_RESOLVED", "NOT_RESOLVED"]
-        found = any(term in content for term in resolution_terms)
-        assert found, "Task resolution query not documented"
+    @pytest.mark.parametrize(
+        "key,message", QUALITY_QUERY_CASES.items(), ids=list(QUALITY_QUERY_CASES)
+    )
+    def test_quality_query_documented(self, query_pattern_terms, key, message):
+        """GenAI Generation, toxicity, instruction adherence and task resolution queries."""
+        assert query_pattern_terms[key], message
 
 
 @pytest.mark.tier4
@@ -241,23 +265,12 @@ class TestQualityAnalysisQueries:
 class TestHallucinationQueries:
     """Test hallucination detection queries are documented."""
 
-    def test_ungrounded_query_documented(self):
-        """UNGROUNDED detection query documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        ungrounded_terms = ["UNGROUNDED", "hallucination", "Hallucination"]
-        found = any(term in content for term in ungrounded_terms)
-        assert found, "UNGROUNDED/hallucination query not documented"
-
-    def test_validation_prompt_documented(self):
-        """ReactValidationPrompt query documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        validation_terms = ["ReactValidationPrompt", "ValidationPrompt"]
-        found = any(term in content for term in validation_terms)
-        assert found, "ReactValidationPrompt query not documented"
+    @pytest.mark.parametrize(
+        "key,message", HALLUCINATION_QUERY_CASES.items(), ids=list(HALLUCINATION_QUERY_CASES)
+    )
+    def test_hallucination_query_documented(self, query_pattern_terms, key, message):
+        """UNGROUNDED detection and ReactValidationPrompt queries."""
+        assert query_pattern_terms[key], message
 
 
 @pytest.mark.tier4
@@ -265,21 +278,12 @@ class TestHallucinationQueries:
 class TestKnowledgeRetrievalQueries:
     """Test knowledge retrieval analysis queries documented."""
 
-    def test_vector_search_documented(self):
-        """vector_search function documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        assert "vector_search" in content, "vector_search query not documented"
-
-    def test_knowledge_index_documented(self):
-        """Knowledge search index query documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        index_terms = ["Search_Index", "Knowledge", "Chunk"]
-        found = any(term in content for term in index_terms)
-        assert found, "Knowledge search index query not documented"
+    @pytest.mark.parametrize(
+        "key,message", KNOWLEDGE_QUERY_CASES.items(), ids=list(KNOWLEDGE_QUERY_CASES)
+    )
+    def test_knowledge_query_documented(self, query_pattern_terms, key, message):
+        """vector_search function and knowledge search index queries."""
+        assert query_pattern_terms[key], message
 
 
 @pytest.mark.tier4
@@ -287,34 +291,20 @@ class TestKnowledgeRetrievalQueries:
 class TestQueryPatternCompleteness:
     """Test query patterns cover all documented use cases."""
 
-    def test_basic_extraction_section_exists(self):
+    def test_basic_extraction_section_exists(self, query_pattern_terms):
         """Basic Extraction section exists."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        assert "Basic Extraction" in content or "Extraction" in content
+        assert query_pattern_terms["extraction"]
 
-    def test_aggregation_section_exists(self):
+    def test_aggregation_section_exists(self, query_pattern_terms):
         """Aggregation queries section exists."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        agg_terms = ["Aggregation", "COUNT", "GROUP BY"]
-        found = any(term in content for term in agg_terms)
+        found = query_pattern_terms["aggregation"]
         assert found, "Aggregation section not found"
 
-    def test_relationship_queries_documented(self):
+    def test_relationship_queries_documented(self, query_pattern_terms):
         """Relationship/join queries documented."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        assert "JOIN" in content, "JOIN queries not documented"
+        assert "JOIN" in query_pattern_terms["join"], "JOIN queries not documented"
 
-    def test_quality_analysis_section_exists(self):
+    def test_quality_analysis_section_exists(self, query_pattern_terms):
         """Quality analysis section exists."""
-        doc_path = SKILL_ROOT / "resources" / "query-patterns.md"
-        content = doc_path.read_text()
-
-        quality_terms = ["Quality", "Analysis", "Toxic", "Trust"]
-        found = any(term in content for term in quality_terms)
+        found = query_pattern_terms["quality"]
         assert found, "Quality analysis section not found"
@@ -10,13 +10,91 @@ Tests that SKILL.md contains required documentation:
 SKILL.md validation
 """
 
-import sys
 import pytest
-from pathlib import Path
 
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
+
+# Terms each check looks for in SKILL.md, scanned in a single pass
+SKILL_MD_TERMS = {
+    "prerequisites": ("Prerequisites", "CRITICAL", "Before"),
+    "data_360": ("Data 360", "Data Cloud", "data_360"),
+    "tracing": ("Session Tracing", "tracing", "Tracing"),
+    "jwt": ("JWT", "jwt", "authentication", "Auth"),
+    "data_model_version": ("1.124", "Data Model", "Standard Data Model"),
+    "billing": ("Billing", "Credit", "cost", "Cost"),
+    "credit": ("credit", "Credit", "consumption", "Consumption"),
+    # Should mention ~24 records per LLM call
+    "llm_estimation": ("24", "records", "LLM", "round-trip"),
+    "extract": ("extract",),
+    "analyze": ("analyze", "analysis", "Analyze"),
+    "debug": ("debug-session", "debug", "Debug"),
+    "flags": ("--org", "--days", "--output"),
+    "stdm": ("STDM", "Session Tracing Data Model", "Data Model"),
+    "entities": ("Session", "Interaction", "Step"),
+    "casing": ("AiAgent", "lowercase", "casing"),
+    "related_skills": (
+        "sf-connected-apps",
+        "sf-ai-agentscript",
+        "sf-ai-agentforce-testing",
+        "sf-debug",
+    ),
+    "integration": (
+        "Integration",
+        "integration",
+        "Cross-Skill",
+        "follow-up",
+        "Skill(",
+    ),
+    "document_map": ("Document Map", "documentation", "Reference"),
+    "data_model_reference_link": ("data-model-reference.md",),
+    "query_patterns_link": ("query-patterns.md",),
+    "insights": ("Key Insights", "Insights", "insights"),
+    "interval": ("5-minute", "5 minute", "collection interval"),
+    "lag": ("lag", "delay", "5-15 minute"),
+}
+
+
+# SKILL_MD_TERMS key -> failure message, for checks needing any one term
+PREREQUISITE_CASES = {
+    "prerequisites": "Prerequisites section not found",
+    "data_360": "Data 360 prerequisite not documented",
+    "tracing": "Session Tracing prerequisite not documented",
+    "jwt": "JWT authentication prerequisite not documented",
+    "data_model_version": "Data Model version requirement not documented",
+}
+
+BILLING_CASES = {
+    "billing": "Billing section not found",
+    "credit": "Credit consumption not documented",
+}
+
+COMMAND_CASES = {
+    "extract": "extract command not documented",
+    "analyze": "analyze command not documented",
+    "debug": "debug-session command not documented",
+}
+
+DATA_MODEL_CASES = {
+    "stdm": "STDM not mentioned in SKILL.md",
+    "casing": "Field casing note not present",
+}
+
+DOCUMENT_MAP_CASES = {
+    "document_map": "Document map section not found",
+    "data_model_reference_link": "data-model-reference.md not linked",
+    "query_patterns_link": "query-patterns.md not linked",
+}
+
+KEY_INSIGHT_CASES = {
+    "insights": "Key Insights section not found",
+    "interval": "Collection interval not documented",
+    "lag": "Session data lag not documented",
+}
+
+
+@pytest.fixture(scope="module")
+def skill_md_terms(skill_md_content: str, term_groups_found) -> dict:
+    """SKILL_MD_TERMS key -> the group's terms present in SKILL.md."""
+    return term_groups_found(skill_md_content, SKILL_MD_TERMS)
 
 
 @pytest.mark.tier4
@@ -24,23 +102,20 @@ sys.path.insert(0, str(SKILL_ROOT))
 class TestSkillMDExists:
     """Test SKILL.md file exists and has required sections."""
 
-    def test_skill_md_exists(self):
+    def test_skill_md_exists(self, skill_md_path):
         """SKILL.md exists in skill root."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        assert skill_md.exists(), "SKILL.md not found"
+        assert skill_md_path.exists(), "SKILL.md not found"
 
-    def test_skill_md_has_frontmatter(self):
+    def test_skill_md_has_frontmatter(self, skill_md_content):
         """SKILL.md has YAML frontmatter."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
+        content = skill_md_content
 
         # Should start with ---
         assert content.startswith("---"), "SKILL.md missing YAML frontmatter"
 
-    def test_skill_md_minimum_length(self):
+    def test_skill_md_minimum_length(self, skill_md_content):
         """SKILL.md has substantial content."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
+        content = skill_md_content
 
         # Should have at least 5000 characters
         assert len(content) > 5000, f"SKILL.md too short: {len(content)} chars"
@@ -51,50 +126,12 @@ class TestSkillMDExists:
 class TestPrerequisitesSection:
     """Test prerequisites checklist is documented."""
 
-    def test_prerequisites_section_exists(self):
-        """Prerequisites section exists."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        prereq_terms = ["Prerequisites", "CRITICAL", "Before"]
-        found = any(term in content for term in prereq_terms)
-        assert found, "Prerequisites section not found"
-
-    def test_data_360_prerequisite(self):
-        """Data 360 enablement is listed as prerequisite."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        data_cloud_terms = ["Data 360", "Data Cloud", "data_360"]
-        found = any(term in content for term in data_cloud_terms)
-        assert found, "Data 360 prerequisite not documented"
-
-    def test_session_tracing_prerequisite(self):
-        """Session Tracing enablement is listed as prerequisite."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        tracing_terms = ["Session Tracing", "tracing", "Tracing"]
-        found = any(term in content for term in tracing_terms)
-        assert found, "Session Tracing prerequisite not documented"
-
-    def test_jwt_auth_prerequisite(self):
-        """JWT authentication is listed as prerequisite."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        jwt_terms = ["JWT", "jwt", "authentication", "Auth"]
-        found = any(term in content for term in jwt_terms)
-        assert found, "JWT authentication prerequisite not documented"
-
-    def test_data_model_version_mentioned(self):
-        """Salesforce Standard Data Model version mentioned."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        version_terms = ["1.124", "Data Model", "Standard Data Model"]
-        found = any(term in content for term in version_terms)
-        assert found, "Data Model version requirement not documented"
+    @pytest.mark.parametrize(
+        "key,message", PREREQUISITE_CASES.items(), ids=list(PREREQUISITE_CASES)
+    )
+    def test_prerequisite_documented(self, skill_md_terms, key, message):
+        """Prerequisites section, Data 360, Session Tracing, JWT auth and Data Model version."""
+        assert skill_md_terms[key], message
 
 
 @pytest.mark.tier4
@@ -102,32 +139,16 @@ class TestPrerequisitesSection:
 class TestBillingSection:
     """Test billing considerations are documented."""
 
-    def test_billing_section_exists(self):
-        """Billing section exists."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        billing_terms = ["Billing", "Credit", "cost", "Cost"]
-        found = any(term in content for term in billing_terms)
-        assert found, "Billing section not found"
-
-    def test_credit_consumption_documented(self):
-        """Credit consumption is documented."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
+    @pytest.mark.parametrize(
+        "key,message", BILLING_CASES.items(), ids=list(BILLING_CASES)
+    )
+    def test_billing_documented(self, skill_md_terms, key, message):
+        """Billing section and credit consumption are documented."""
+        assert skill_md_terms[key], message
 
-        credit_terms = ["credit", "Credit", "consumption", "Consumption"]
-        found = any(term in content for term in credit_terms)
-        assert found, "Credit consumption not documented"
-
-    def test_records_per_llm_call_documented(self):
+    def test_records_per_llm_call_documented(self, skill_md_terms):
         """Records per LLM call estimation documented."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        # Should mention ~24 records per LLM call
-        estimation_terms = ["24", "records", "LLM", "round-trip"]
-        found = sum(1 for term in estimation_terms if term in content) >= 2
+        found = len(skill_md_terms["llm_estimation"]) >= 2
         assert found, "Records per LLM call estimation not documented"
 
 
@@ -136,38 +157,16 @@ class TestBillingSection:
 class TestCLIDocumentation:
     """Test CLI commands are documented."""
 
-    def test_extract_command_documented(self):
-        """extract command is documented."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        assert "extract" in content, "extract command not documented"
-
-    def test_analyze_command_documented(self):
-        """analyze command is documented."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        analyze_terms = ["analyze", "analysis", "Analyze"]
-        found = any(term in content for term in analyze_terms)
-        assert found, "analyze command not documented"
-
-    def test_debug_session_documented(self):
-        """debug-session command is documented."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
+    @pytest.mark.parametrize(
+        "key,message", COMMAND_CASES.items(), ids=list(COMMAND_CASES)
+    )
+    def test_command_documented(self, skill_md_terms, key, message):
+        """extract, analyze and debug-session commands are documented."""
+        assert skill_md_terms[key], message
 
-        debug_terms = ["debug-session", "debug", "Debug"]
-        found = any(term in content for term in debug_terms)
-        assert found, "debug-session command not documented"
-
-    def test_common_flags_documented(self):
+    def test_common_flags_documented(self, skill_md_terms):
         """Common CLI flags are documented."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        flags = ["--org", "--days", "--output"]
-        found = sum(1 for flag in flags if flag in content) >= 2
+        found = len(skill_md_terms["flags"]) >= 2
         assert found, "Common CLI flags not documented"
 
 
@@ -176,67 +175,32 @@ class TestCLIDocumentation:
 class TestDataModelSection:
     """Test data model overview is documented in SKILL.md."""
 
-    def test_stdm_mentioned(self):
-        """STDM (Session Tracing Data Model) mentioned."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        stdm_terms = ["STDM", "Session Tracing Data Model", "Data Model"]
-        found = any(term in content for term in stdm_terms)
-        assert found, "STDM not mentioned in SKILL.md"
+    @pytest.mark.parametrize(
+        "key,message", DATA_MODEL_CASES.items(), ids=list(DATA_MODEL_CASES)
+    )
+    def test_data_model_documented(self, skill_md_terms, key, message):
+        """STDM and the field casing note (AiAgent vs AIAgent) are present."""
+        assert skill_md_terms[key], message
 
-    def test_dmo_entities_listed(self):
+    def test_dmo_entities_listed(self, skill_md_terms):
         """Core DMO entities are listed."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        entities = ["Session", "Interaction", "Step"]
-        found = sum(1 for e in entities if e in content) >= 2
+        found = len(skill_md_terms["entities"]) >= 2
         assert found, "Core DMO entities not listed"
 
-    def test_field_casing_note(self):
-        """Field casing note (AiAgent vs AIAgent) present."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        casing_terms = ["AiAgent", "lowercase", "casing"]
-        found = any(term in content for term in casing_terms)
-        assert found, "Field casing note not present"
-
 
 @pytest.mark.tier4
 @pytest.mark.offline
 class TestCrossSkillIntegration:
     """Test cross-skill integration is documented."""
 
-    def test_related_skills_mentioned(self):
+    def test_related_skills_mentioned(self, skill_md_terms):
         """Related skills are mentioned."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        related_skills = [
-            "sf-connected-apps",
-            "sf-ai-agentscript",
-            "sf-ai-agentforce-testing",
-            "sf-debug",
-        ]
-
-        found = sum(1 for s in related_skills if s in content) >= 2
+        found = len(skill_md_terms["related_skills"]) >= 2
         assert found, "Related skills not documented"
 
-    def test_skill_chaining_documented(self):
+    def test_skill_chaining_documented(self, skill_md_terms):
         """Skill chaining/integration documented."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        integration_terms = [
-            "Integration",
-            "integration",
-            "Cross-Skill",
-            "follow-up",
-            "Skill(",
-        ]
-        found = any(term in content for term in integration_terms)
+        found = skill_md_terms["integration"]
         assert found, "Skill chaining not documented"
 
 
@@ -245,28 +209,12 @@ class TestCrossSkillIntegration:
 class TestDocumentMapSection:
     """Test document map/navigation is provided."""
 
-    def test_document_map_exists(self):
-        """Document map section exists."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        map_terms = ["Document Map", "documentation", "Reference"]
-        found = any(term in content for term in map_terms)
-        assert found, "Document map section not found"
-
-    def test_data_model_reference_linked(self):
-        """data-model-reference.md is linked."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        assert "data-model-reference.md" in content, "data-model-reference.md not linked"
-
-    def test_query_patterns_linked(self):
-        """query-patterns.md is linked."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        assert "query-patterns.md" in content, "query-patterns.md not linked"
+    @pytest.mark.parametrize(
+        "key,message", DOCUMENT_MAP_CASES.items(), ids=list(DOCUMENT_MAP_CASES)
+    )
+    def test_document_map_entry(self, skill_md_terms, key, message):
+        """Document map exists and links data-model-reference.md and query-patterns.md."""
+        assert skill_md_terms[key], message
 
 
 @pytest.mark.tier4
@@ -274,29 +222,9 @@ class TestDocumentMapSection:
 class TestKeyInsightsSection:
     """Test key insights section is documented."""
 
-    def test_key_insights_section_exists(self):
-        """Key Insights section exists."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        insight_terms = ["Key Insights", "Insights", "insights"]
-        found = any(term in content for term in insight_terms)
-        assert found, "Key Insights section not found"
-
-    def test_collection_interval_documented(self):
-        """5-minute collection interval documented."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        interval_terms = ["5-minute", "5 minute", "collection interval"]
-        found = any(term in content for term in interval_terms)
-        assert found, "Collection interval not documented"
-
-    def test_session_lag_documented(self):
-        """Session data lag is documented."""
-        skill_md = SKILL_ROOT / "SKILL.md"
-        content = skill_md.read_text()
-
-        lag_terms = ["lag", "delay", "5-15 minute"]
-        found = any(term in content for term in lag_terms)
-        assert found, "Session data lag not documented"
+    @pytest.mark.parametrize(
+        "key,message", KEY_INSIGHT_CASES.items(), ids=list(KEY_INSIGHT_CASES)
+    )
+    def test_key_insight_documented(self, skill_md_terms, key, message):
+        """Key Insights section, 5-minute collection interval and session lag."""
+        assert skill_md_terms[key], message
@@ -8,85 +8,89 @@ Tests auth errors produce helpful messages:
 SKILL.md Section: "Common Issues & Fixes"
 """
 
-import sys
 import pytest
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from collections import namedtuple
 
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(SKILL_ROOT))
+# Skip the module cleanly if the auth dependencies (PyJWT, httpx,
+# cryptography) are not installed
+auth_module = pytest.importorskip("scripts.auth")
+Data360Auth = auth_module.Data360Auth
+OrgInfo = auth_module.OrgInfo
 
+import httpx  # after the skip: scripts.auth depends on it
 
-@pytest.mark.tier5
-@pytest.mark.offline
-class TestAuthFailures:
-    """Test auth failure error messages (5 points)."""
 
-    def test_missing_key_suggests_generation_command(self):
-        """Missing key error suggests openssl command."""
-        from scripts.auth import Data360Auth
+# Canned `sf org display --json` result for a reachable org
+_FakeProc = namedtuple('_FakeProc', 'stdout returncode')
+_ORG_DISPLAY = _FakeProc(
+    stdout='{"status": 0, "result": {"instanceUrl": "https://test.salesforce.com", "username": "test@example.com"}}',
+    returncode=0
+)
 
-        with tempfile.TemporaryDirectory() as jwt_dir:
-            jwt_path = Path(jwt_dir)
+# Output fragments that indicate user-friendly CLI error handling
+FRIENDLY_ERROR_INDICATORS = frozenset({"error", "failed", "not found", "cannot"})
 
-            with patch('scripts.auth.DEFAULT_KEY_DIR', jwt_path):
-                with patch.object(Data360Auth, '_get_org_info') as mock_org:
-                    mock_org.return_value = MagicMock(
-                        instance_url="https://test.salesforce.com",
-                        username="test@example.com",
-                        is_sandbox=False
-                    )
 
-                    auth = Data360Auth(
-                        org_alias="test-org",
-                        consumer_key="test-key"
-                    )
+@pytest.fixture
+def jwt_scaffold(tmp_path, monkeypatch):
+    """Empty JWT key directory patched in as scripts.auth.DEFAULT_KEY_DIR."""
+    monkeypatch.setattr('scripts.auth.DEFAULT_KEY_DIR', tmp_path)
+    return tmp_path
 
-                    with pytest.raises(FileNotFoundError) as exc_info:
-                        auth._load_private_key()
 
-                    error_msg = str(exc_info.value).lower()
+@pytest.fixture
+def stub_org_info(monkeypatch):
+    """Stub Data360Auth._get_org_info so no sf CLI call is made."""
+    org_info = OrgInfo(
+        instance_url="https://test.salesforce.com",
+        username="test@example.com",
+        is_sandbox=False
+    )
+    monkeypatch.setattr(Data360Auth, '_get_org_info', lambda self: org_info)
+    return org_info
 
-                    # Should mention openssl or generation
-                    assert "openssl" in error_msg or "generate" in error_msg
 
-    def test_missing_consumer_key_lists_all_options(self):
-        """Missing consumer key error lists file and env options."""
-        from scripts.auth import Data360Auth
-        import os
+@pytest.mark.tier5
+@pytest.mark.offline
+class TestAuthFailures:
+    """Test auth failure error messages (5 points)."""
 
-        with tempfile.TemporaryDirectory() as jwt_dir:
-            jwt_path = Path(jwt_dir)
+    def test_missing_key_suggests_generation_command(self, jwt_scaffold, stub_org_info):
+        """Missing key error suggests openssl command."""
+        auth = Data360Auth(
+            org_alias="test-org",
+            consumer_key="test-key"
+        )
 
-            # Create key file but no consumer key
-            key_file = jwt_path / "test-org.key"
-            key_file.write_text("test")
+        with pytest.raises(FileNotFoundError) as exc_info:
+            auth._load_private_key()
 
-            # Clear env vars
-            for var in list(os.environ.keys()):
-                if var.startswith("SF_") and "CONSUMER_KEY" in var:
-                    os.environ.pop(var, None)
+        error_msg = str(exc_info.value).lower()
+
+        # Should mention openssl or generation
+        assert "openssl" in error_msg or "generate" in error_msg
+
+    def test_missing_consumer_key_lists_all_options(self, jwt_scaffold, stub_org_info,
+                                                    monkeypatch):
+        """Missing consumer key error lists file and env options."""
+        # Create key file but no consumer key
+        key_file = jwt_scaffold / "test-org.key"
+        key_file.write_text("test")
 
-            with patch('scripts.auth.DEFAULT_KEY_DIR', jwt_path):
-                with patch.object(Data360Auth, '_get_org_info') as mock_org:
-                    mock_org.return_value = MagicMock(
-                        instance_url="https://test.salesforce.com",
-                        username="test@example.com",
-                        is_sandbox=False
-                    )
+        # Clear the env vars Data360Auth consults for org "test-org"
+        monkeypatch.delenv("SF_TEST_ORG_CONSUMER_KEY", raising=False)
+        monkeypatch.delenv("SF_CONSUMER_KEY", raising=False)
 
-                    with pytest.raises(ValueError) as exc_info:
-                        Data360Auth(org_alias="test-org")
+        with pytest.raises(ValueError) as exc_info:
+            Data360Auth(org_alias="test-org")
 
-                    error_msg = str(exc_info.value)
+        error_msg = str(exc_info.value)
 
-                    # Should mention file option
-                    assert ".consumer-key" in error_msg or "File" in error_msg
+        # Should mention file option
+        assert ".consumer-key" in error_msg or "File" in error_msg
 
-                    # Should mention env option
-                    assert "SF_" in error_msg or "environment" in error_msg.lower()
+        # Should mention env option
+        assert "SF_" in error_msg or "environment" in error_msg.lower()
 
     def test_cli_auth_error_is_not_stacktrace(self, cli_runner, cli_app):
         """CLI auth errors show user-friendly message, not full stacktrace."""
@@ -103,9 +107,7 @@ class TestAuthFailures:
         # (may have "Error:" prefix which is OK)
         output_lower = result.output.lower()
 
-        # These indicate user-friendly error handling
-        friendly_indicators = ["error", "failed", "not found", "cannot"]
-        has_friendly_message = any(ind in output_lower for ind in friendly_indicators)
+        has_friendly_message = any(ind in output_lower for ind in FRIENDLY_ERROR_INDICATORS)
 
         assert has_friendly_message or len(result.output) < 500, \
             "Auth error should produce user-friendly message"
@@ -116,36 +118,28 @@ class TestAuthFailures:
 class TestConnectionFailures:
     """Test connection failure handling."""
 
-    def test_connection_timeout_handled(self):
+    def test_connection_timeout_handled(self, jwt_scaffold, monkeypatch):
         """Connection timeouts produce clear error."""
-        from scripts.auth import Data360Auth
-        import httpx
+        # Create auth files (key content doesn't matter - we'll mock JWT creation)
+        key_file = jwt_scaffold / "test-org.key"
+        key_file.write_text("mock-key-content")
 
-        with tempfile.TemporaryDirectory() as jwt_dir:
-            jwt_path = Path(jwt_dir)
+        consumer_key_file = jwt_scaffold / "test-org.consumer-key"
+        consumer_key_file.write_text("test-consumer-key")
 
-            # Create auth files (key content doesn't matter - we'll mock JWT creation)
-            key_file = jwt_path / "test-org.key"
-            key_file.write_text("mock-key-content")
+        # Mock sf CLI to return valid org info
+        monkeypatch.setattr('subprocess.run', lambda *args, **kwargs: _ORG_DISPLAY)
 
-            consumer_key_file = jwt_path / "test-org.consumer-key"
-            consumer_key_file.write_text("test-consumer-key")
+        auth = Data360Auth(org_alias="test-org")
 
-            with patch('scripts.auth.DEFAULT_KEY_DIR', jwt_path):
-                # Mock sf CLI to return valid org info
-                with patch('subprocess.run') as mock_run:
-                    mock_run.return_value = MagicMock(
-                        stdout='{"status": 0, "result": {"instanceUrl": "https://test.salesforce.com", "username": "test@example.com"}}',
-                        returncode=0
-                    )
+        # Mock JWT assertion creation to skip actual key parsing
+        monkeypatch.setattr(auth, '_create_jwt_assertion', lambda: "mock-jwt-assertion")
 
-                    auth = Data360Auth(org_alias="test-org")
+        # Mock httpx to timeout
+        def post_timeout(*args, **kwargs):
+            raise httpx.TimeoutException("Connection timed out")
 
-                    # Mock JWT assertion creation to skip actual key parsing
-                    with patch.object(auth, '_create_jwt_assertion', return_value="mock-jwt-assertion"):
-                        # Mock httpx to timeout
-                        with patch.object(httpx.Client, 'post') as mock_post:
-                            mock_post.side_effect = httpx.TimeoutException("Connection timed out")
+        monkeypatch.setattr(httpx.Client, 'post', post_timeout)
 
-                            with pytest.raises((RuntimeError, httpx.TimeoutException)):
-                                auth.get_token()
+        with pytest.raises((RuntimeError, httpx.TimeoutException)):
+            auth.get_token()
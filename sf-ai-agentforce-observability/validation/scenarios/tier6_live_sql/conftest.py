@@ -12,21 +12,12 @@ import pytest
 import re
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
-from pathlib import Path
 
 
 # Query execution timeout (seconds)
 QUERY_TIMEOUT = 120
 
 
-@pytest.fixture(scope="session")
-def query_patterns_content() -> str:
-    """Load query-patterns.md content once per session."""
-    skill_root = Path(__file__).parent.parent.parent.parent
-    doc_path = skill_root / "resources" / "query-patterns.md"
-    return doc_path.read_text()
-
-
 @pytest.fixture(scope="session")
 def all_sql_blocks(query_patterns_content: str) -> List[str]:
     """Extract all SQL blocks from query-patterns.md."""
@@ -8,6 +8,7 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import re
 import sys
@@ -19,9 +20,14 @@ VALIDATION_DIR = Path(__file__).parent.parent
 VALIDATION_MD_PATH = VALIDATION_DIR / "VALIDATION.md"
 REGISTRY_PATH = VALIDATION_DIR / "scenario_registry.json"
 
+# VALIDATION.md "Current Status" table rows
+_RE_STATUS_ROW = re.compile(r"\| (Last Validation|Overall Score|Status) \| .* \|")
+HISTORY_MARKER = "## Validation History"
 
+
+@functools.lru_cache(maxsize=1)
 def load_registry() -> dict:
-    """Load scenario registry."""
+    """Load scenario registry (parsed once per process; treat as read-only)."""
     with open(REGISTRY_PATH) as f:
         return json.load(f)
 
@@ -78,12 +84,30 @@ def generate_status_badge(scores: dict, registry: dict) -> str:
         return "🔴 FAIL"
 
 
+def _format_row(tier: str, scores: dict, tiers_config: dict) -> str:
+    """Render one tier's row of the run entry table."""
+    tier_scores = scores.get(tier, {"score": 0, "max": 0, "passed": 0, "failed": 0, "skipped": 0})
+    max_score = tiers_config.get(tier, {}).get("weight", 0)
+
+    if tier_scores["failed"] == 0 and tier_scores["passed"] > 0:
+        status = "✅"
+    elif tier_scores["passed"] == 0 and tier_scores["failed"] == 0:
+        status = "⏳"
+    else:
+        status = "❌"
+
+    notes = f"{tier_scores['skipped']} skipped" if tier_scores["skipped"] > 0 else ""
+
+    return f"| {tier} | {tier_scores['score']:.0f}/{max_score} | {status} | {notes} |"
+
+
 def generate_run_entry(results: list, scores: dict, registry: dict, org: str) -> str:
     """Generate a validation run entry for VALIDATION.md."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
     tiers_config = registry.get("tiers", {})
+    total = scores["total"]
 
-    lines = [
+    header = [
         f"### Run - {timestamp}",
         "",
         f"**Org:** {org}",
@@ -92,33 +116,14 @@ def generate_run_entry(results: list, scores: dict, registry: dict, org: str) ->
         "| Tier | Score | Status | Notes |",
         "|------|-------|--------|-------|",
     ]
+    rows = [_format_row(tier, scores, tiers_config) for tier in ("T1", "T2", "T3", "T4", "T5")]
+    footer = [
+        f"| **Total** | **{total['score']:.0f}/{total['max']}** | "
+        f"**{total['percentage']:.0f}%** | |",
+        "",
+    ]
 
-    for tier in ["T1", "T2", "T3", "T4", "T5"]:
-        tier_scores = scores.get(tier, {"score": 0, "max": 0, "passed": 0, "failed": 0})
-        tier_config = tiers_config.get(tier, {})
-        max_score = tier_config.get("weight", 0)
-
-        if tier_scores["failed"] == 0 and tier_scores["passed"] > 0:
-            status = "✅"
-        elif tier_scores["passed"] == 0 and tier_scores["failed"] == 0:
-            status = "⏳"
-        else:
-            status = "❌"
-
-        notes = ""
-        if tier_scores["skipped"] > 0:
-            notes = f"{tier_scores['skipped']} skipped"
-
-        lines.append(
-            f"| {tier} | {tier_scores['score']:.0f}/{max_score} | {status} | {notes} |"
-        )
-
-    total = scores["total"]
-    lines.append(f"| **Total** | **{total['score']:.0f}/{total['max']}** | "
-                 f"**{total['percentage']:.0f}%** | |")
-    lines.append("")
-
-    return "\n".join(lines)
+    return "\n".join(header + rows + footer)
 
 
 def update_validation_md(new_entry: str, scores: dict, registry: dict):
@@ -129,38 +134,28 @@ def update_validation_md(new_entry: str, scores: dict, registry: dict):
 
     content = VALIDATION_MD_PATH.read_text()
 
-    # Update current status section
+    # Current status rows, keyed by metric name
     status_badge = generate_status_badge(scores, registry)
     total = scores["total"]
+    rows = {
+        "Last Validation": datetime.now().strftime('%Y-%m-%d'),
+        "Overall Score": f"{total['score']:.0f}/{total['max']} ({total['percentage']:.0f}%)",
+        "Status": status_badge,
+    }
 
-    # Update Last Validation
-    content = re.sub(
-        r"\| Last Validation \| .* \|",
-        f"| Last Validation | {datetime.now().strftime('%Y-%m-%d')} |",
-        content
-    )
-
-    # Update Overall Score
-    content = re.sub(
-        r"\| Overall Score \| .* \|",
-        f"| Overall Score | {total['score']:.0f}/{total['max']} ({total['percentage']:.0f}%) |",
-        content
-    )
+    def _status_row(match: re.Match) -> str:
+        return f"| {match.group(1)} | {rows[match.group(1)]} |"
 
-    # Update Status
-    content = re.sub(
-        r"\| Status \| .* \|",
-        f"| Status | {status_badge} |",
-        content
-    )
+    # Only the part before Validation History holds the status table; the
+    # history tables have their own "| Status |" column headers
+    header, marker, history = content.partition(HISTORY_MARKER)
+    header = _RE_STATUS_ROW.sub(_status_row, header, count=len(rows))
 
-    # Add new run entry to Validation History
-    history_marker = "## Validation History"
-    if history_marker in content:
-        # Insert new entry after the header
-        parts = content.split(history_marker)
-        if len(parts) == 2:
-            content = parts[0] + history_marker + "\n\n" + new_entry + parts[1].lstrip()
+    if marker:
+        # Insert new entry after the history header
+        content = "".join([header, marker, "\n\n", new_entry, history.lstrip()])
+    else:
+        content = header
 
     VALIDATION_MD_PATH.write_text(content)
     print(f"Updated {VALIDATION_MD_PATH}")
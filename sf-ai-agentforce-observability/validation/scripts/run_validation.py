@@ -19,21 +19,23 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
+import importlib.util
+import io
 import json
-import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-# Rich for pretty output
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+import pytest
+
+# pytest-xdist, for parallel tier runs
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+# Rich for pretty output (imported only when rendering tables)
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
 
 
 # Paths
@@ -42,87 +44,144 @@ SCENARIOS_DIR = VALIDATION_DIR / "scenarios"
 REGISTRY_PATH = VALIDATION_DIR / "scenario_registry.json"
 VALIDATION_MD_PATH = VALIDATION_DIR / "VALIDATION.md"
 
-
+# Tier -> pytest marker
+TIER_MARKERS = {
+    "T1": "tier1",
+    "T2": "tier2",
+    "T3": "tier3",
+    "T4": "tier4",
+    "T5": "tier5",
+}
+MARKER_TIERS = {marker: tier for tier, marker in TIER_MARKERS.items()}
+
+# pytest exit codes where the session itself broke, not just some tests
+ABORTED_EXIT_CODES = {
+    pytest.ExitCode.INTERRUPTED,
+    pytest.ExitCode.INTERNAL_ERROR,
+    pytest.ExitCode.USAGE_ERROR,
+}
+
+
+@functools.lru_cache(maxsize=1)
 def load_registry() -> dict:
-    """Load scenario registry configuration."""
+    """Load scenario registry configuration (parsed once per process; treat as read-only)."""
     with open(REGISTRY_PATH) as f:
         return json.load(f)
 
 
+class ResultCollector:
+    """
+    pytest plugin that tallies test outcomes per tier marker.
+
+    Each test is counted once, keyed by nodeid: a failure or error in any
+    phase makes it failed, a skip makes it skipped, otherwise the call
+    outcome counts. Setup/teardown errors count as failures.
+
+    A module that fails to collect counts as one failure against the tier
+    of its scenario directory, or against every requested tier when the
+    path names no tier (e.g. a broken conftest).
+    """
+
+    def __init__(self, tiers: List[str]):
+        self.tiers = tiers
+        self.outcomes: Dict[str, Tuple[str, str]] = {}  # nodeid -> (tier, outcome)
+        self.collect_errors: Dict[str, str] = {}  # nodeid -> longreprtext
+        self.output = {tier: [] for tier in TIER_MARKERS}
+
+    def pytest_runtest_logreport(self, report):
+        """Record the outcome of one test phase for its tier."""
+        tier = next(
+            (t for t, marker in TIER_MARKERS.items() if marker in report.keywords),
+            None
+        )
+        if tier is None:
+            return
+
+        if report.failed:
+            self.outcomes[report.nodeid] = (tier, "failed")
+            self.output[tier].append(f"{report.nodeid}\n{report.longreprtext}")
+        elif report.skipped or report.when == "call":
+            # A failure recorded by an earlier phase always wins
+            if self.outcomes.get(report.nodeid, (tier, None))[1] != "failed":
+                self.outcomes[report.nodeid] = (tier, report.outcome)
+
+    def pytest_collectreport(self, report):
+        """Record a module or package that failed to collect."""
+        if report.failed:
+            self.collect_errors[report.nodeid] = report.longreprtext
+
+    @property
+    def counts(self) -> Dict[str, Dict]:
+        """Per-tier passed/failed/skipped counts plus failure output."""
+        counts = {
+            tier: {"passed": 0, "failed": 0, "skipped": 0, "output": self.output[tier]}
+            for tier in TIER_MARKERS
+        }
+        for tier, outcome in self.outcomes.values():
+            counts[tier][outcome] += 1
+        for nodeid, longreprtext in self.collect_errors.items():
+            tier = collect_tier(nodeid)
+            for error_tier in [tier] if tier else self.tiers:
+                counts[error_tier]["failed"] += 1
+                counts[error_tier]["output"].append(f"{nodeid}\n{longreprtext}")
+        return counts
+
+
+def collect_tier(nodeid: str) -> Optional[str]:
+    """Tier of a collected path, from its tierN_* scenario directory (None if unnamed)."""
+    for part in Path(nodeid.split("::")[0]).parts:
+        tier = MARKER_TIERS.get(part.split("_")[0])
+        if tier:
+            return tier
+    return None
+
+
 def run_pytest(
-    tier: Optional[str] = None,
+    tiers: List[str],
     offline: bool = False,
     org_alias: str = "Vivint-DevInt",
     verbose: bool = False
-) -> Tuple[int, int, int, str]:
+) -> Tuple[Dict[str, Dict], str, pytest.ExitCode]:
     """
-    Run pytest and return results.
+    Run pytest in-process for the given tiers in a single session.
+
+    Uses pytest-xdist (-n auto) when installed; ResultCollector sees the
+    worker reports on the controller, tier markers included. Workers keep
+    running past a collection error, so one is reported as INTERRUPTED,
+    as a serial session would.
 
     Returns:
-        Tuple of (passed, failed, skipped, output)
+        Tuple of (per-tier counts from ResultCollector, pytest output,
+        pytest exit code)
     """
-    cmd = [
-        sys.executable, "-m", "pytest",
+    args = [
         str(SCENARIOS_DIR),
         "-v",
         "--tb=short",
         f"--org={org_alias}",
+        "-m", " or ".join(TIER_MARKERS[tier] for tier in tiers),
     ]
 
     if offline:
-        cmd.append("--offline")
-
-    if tier:
-        # Map tier to marker
-        tier_markers = {
-            "T1": "tier1",
-            "T2": "tier2",
-            "T3": "tier3",
-            "T4": "tier4",
-            "T5": "tier5",
-        }
-        marker = tier_markers.get(tier.upper())
-        if marker:
-            cmd.extend(["-m", marker])
+        args.append("--offline")
 
     if verbose:
-        cmd.append("-vv")
-
-    # Run pytest
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        cwd=VALIDATION_DIR.parent  # Run from skill root
-    )
+        args.append("-vv")
+
+    if XDIST_AVAILABLE:
+        # Spread test files across workers; loadfile keeps each module's
+        # tests (and their module-scoped fixtures) on one worker
+        args.extend(["-n", "auto", "--dist=loadfile"])
 
-    output = result.stdout + result.stderr
-
-    # Parse results from output
-    passed = 0
-    failed = 0
-    skipped = 0
-
-    # Look for summary line like "5 passed, 2 failed, 1 skipped"
-    for line in output.split('\n'):
-        if 'passed' in line or 'failed' in line or 'skipped' in line:
-            if ' passed' in line:
-                try:
-                    passed = int(line.split(' passed')[0].split()[-1])
-                except (ValueError, IndexError):
-                    pass
-            if ' failed' in line:
-                try:
-                    failed = int(line.split(' failed')[0].split()[-1])
-                except (ValueError, IndexError):
-                    pass
-            if ' skipped' in line:
-                try:
-                    skipped = int(line.split(' skipped')[0].split()[-1])
-                except (ValueError, IndexError):
-                    pass
-
-    return passed, failed, skipped, output
+    collector = ResultCollector(tiers)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        exit_code = pytest.main(args, plugins=[collector])
+
+    if collector.collect_errors:
+        exit_code = pytest.ExitCode.INTERRUPTED
+
+    return collector.counts, output.getvalue(), exit_code
 
 
 def calculate_tier_score(tier_name: str, passed: int, total: int, weight: int) -> float:
@@ -134,34 +193,27 @@ def calculate_tier_score(tier_name: str, passed: int, total: int, weight: int) -
     return pass_rate * weight
 
 
-def run_tier_tests(
-    tier_name: str,
-    offline: bool,
-    org_alias: str,
-    verbose: bool
-) -> Dict:
-    """Run tests for a specific tier and return results."""
-    passed, failed, skipped, output = run_pytest(
-        tier=tier_name,
-        offline=offline,
-        org_alias=org_alias,
-        verbose=verbose
-    )
-
-    total = passed + failed
+def tier_result(tier_name: str, counts: Dict) -> Dict:
+    """Build the result entry for a tier from its collected counts."""
+    passed = counts["passed"]
+    failed = counts["failed"]
 
     return {
         "tier": tier_name,
         "passed": passed,
         "failed": failed,
-        "skipped": skipped,
-        "total": total,
-        "output": output
+        "skipped": counts["skipped"],
+        "total": passed + failed,
+        "output": "\n\n".join(counts["output"])
     }
 
 
 def print_results_rich(results: List[Dict], registry: dict):
     """Print results using Rich tables."""
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
+
     console = Console()
 
     # Header
@@ -353,13 +405,34 @@ Examples:
     else:
         tiers_to_run = ["T1", "T2", "T3", "T4", "T5"]
 
-    # Run tests
+    # Skip live API tiers in offline mode
+    tiers_config = registry.get("tiers", {})
+    offline_skipped = {
+        tier for tier in tiers_to_run
+        if args.offline and tiers_config.get(tier, {}).get("requires_live_api", False)
+    }
+
+    # Run every remaining tier in one pytest session
+    tiers_live = [tier for tier in tiers_to_run if tier not in offline_skipped]
+    counts = {}
+    exit_code = pytest.ExitCode.OK
+    if tiers_live:
+        counts, output, exit_code = run_pytest(
+            tiers=tiers_live,
+            offline=args.offline,
+            org_alias=args.org,
+            verbose=args.verbose
+        )
+
+        if args.verbose:
+            print("\n--- pytest Output ---")
+            print(output)
+        elif exit_code in ABORTED_EXIT_CODES:
+            print(output, file=sys.stderr)
+
     results = []
     for tier in tiers_to_run:
-        tier_config = registry.get("tiers", {}).get(tier, {})
-
-        # Skip live API tiers in offline mode
-        if args.offline and tier_config.get("requires_live_api", False):
+        if tier in offline_skipped:
             results.append({
                 "tier": tier,
                 "passed": 0,
@@ -368,19 +441,8 @@ Examples:
                 "total": 0,
                 "output": "Skipped (offline mode)"
             })
-            continue
-
-        result = run_tier_tests(
-            tier_name=tier,
-            offline=args.offline,
-            org_alias=args.org,
-            verbose=args.verbose
-        )
-        results.append(result)
-
-        if args.verbose:
-            print(f"\n--- {tier} Output ---")
-            print(result["output"])
+        else:
+            results.append(tier_result(tier, counts[tier]))
 
     # Output results
     if args.json:
@@ -401,6 +463,9 @@ Examples:
 
     # Exit code based on results
     total_failed = sum(r["failed"] for r in results)
+    if exit_code in ABORTED_EXIT_CODES:
+        print(f"pytest session aborted ({exit_code.name})", file=sys.stderr)
+        sys.exit(int(exit_code))
     sys.exit(0 if total_failed == 0 else 1)
 
 
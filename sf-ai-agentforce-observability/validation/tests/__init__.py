@@ -0,0 +1,5 @@
+"""
+Tests for the validation tooling itself (scripts/), not the skill.
+
+Unmarked, so run_validation.py never scores them.
+"""
@@ -0,0 +1,162 @@
+"""
+Runner Tests: ResultCollector tallies
+
+Tests run_validation.ResultCollector counts each test once per nodeid:
+- A teardown error after a passing call counts only as failed
+- Setup skips count as skipped, clean calls as passed
+- Modules that fail to collect count as failures, and an aborted
+  pytest session makes the runner exit non-zero
+"""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+RUN_VALIDATION_PATH = Path(__file__).parent.parent / "scripts" / "run_validation.py"
+
+
+@pytest.fixture(scope="module")
+def run_validation():
+    """scripts/run_validation.py loaded by path (validation/scripts is not a package)."""
+    spec = importlib.util.spec_from_file_location("run_validation", RUN_VALIDATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _report(nodeid: str, when: str, outcome: str, marker: str = "tier3"):
+    """Minimal stand-in for a pytest TestReport."""
+    return SimpleNamespace(
+        nodeid=nodeid,
+        when=when,
+        outcome=outcome,
+        passed=outcome == "passed",
+        failed=outcome == "failed",
+        skipped=outcome == "skipped",
+        keywords={marker: 1},
+        longreprtext=f"{nodeid} {when} {outcome}",
+    )
+
+
+def _collect_error(nodeid: str):
+    """Minimal stand-in for a failed pytest CollectReport."""
+    return SimpleNamespace(
+        nodeid=nodeid,
+        failed=True,
+        longreprtext=f"ImportError while importing test module '{nodeid}'",
+    )
+
+
+def _collect(run_validation, reports, collect_reports=(), tiers=("T3", "T4")) -> dict:
+    """Feed reports through a fresh ResultCollector; return its counts."""
+    collector = run_validation.ResultCollector(list(tiers))
+    for report in collect_reports:
+        collector.pytest_collectreport(report)
+    for report in reports:
+        collector.pytest_runtest_logreport(report)
+    return collector.counts
+
+
+# (phase outcomes per test, expected T3 passed/failed/skipped)
+OUTCOME_CASES = [
+    pytest.param([("setup", "passed"), ("call", "passed"), ("teardown", "passed")],
+                 (1, 0, 0), id="passed"),
+    pytest.param([("setup", "passed"), ("call", "passed"), ("teardown", "failed")],
+                 (0, 1, 0), id="teardown-error-after-pass"),
+    pytest.param([("setup", "passed"), ("call", "failed"), ("teardown", "failed")],
+                 (0, 1, 0), id="teardown-error-after-fail"),
+    pytest.param([("setup", "failed"), ("teardown", "passed")],
+                 (0, 1, 0), id="setup-error"),
+    pytest.param([("setup", "skipped"), ("teardown", "passed")],
+                 (0, 0, 1), id="setup-skip"),
+]
+
+
+class TestResultCollector:
+    """Test ResultCollector counts one outcome per test."""
+
+    @pytest.mark.parametrize("phases,expected", OUTCOME_CASES)
+    def test_one_outcome_per_test(self, run_validation, phases, expected):
+        """Every phase report of a test tallies to exactly one outcome."""
+        counts = _collect(run_validation, [
+            _report("test_x.py::test_a", when, outcome) for when, outcome in phases
+        ])
+
+        t3 = counts["T3"]
+        assert (t3["passed"], t3["failed"], t3["skipped"]) == expected
+
+    def test_failure_output_kept_per_failing_phase(self, run_validation):
+        """A teardown error is still reported in the tier output."""
+        counts = _collect(run_validation, [
+            _report("test_x.py::test_a", "call", "passed"),
+            _report("test_x.py::test_a", "teardown", "failed"),
+        ])
+
+        assert len(counts["T3"]["output"]) == 1
+        assert "teardown" in counts["T3"]["output"][0]
+
+    def test_unmarked_tests_ignored(self, run_validation):
+        """Reports without a tier marker are not counted."""
+        counts = _collect(run_validation, [
+            _report("test_x.py::test_a", "call", "passed", marker="slow"),
+        ])
+
+        assert all(c["passed"] == 0 for c in counts.values())
+
+
+class TestCollectionErrors:
+    """Test a module that fails to import is never dropped from the tally."""
+
+    def test_collect_error_counts_against_its_tier(self, run_validation):
+        """A broken tier3 module fails T3 even when its other tests pass."""
+        counts = _collect(
+            run_validation,
+            [_report("scenarios/tier3_analysis/test_ok.py::test_a", "call", "passed")],
+            [_collect_error("scenarios/tier3_analysis/test_broken.py")],
+        )
+
+        assert (counts["T3"]["passed"], counts["T3"]["failed"]) == (1, 1)
+        assert "test_broken.py" in counts["T3"]["output"][0]
+        assert counts["T4"]["failed"] == 0
+
+    def test_collect_error_without_tier_counts_against_all(self, run_validation):
+        """A collect error outside any tier directory fails every requested tier."""
+        counts = _collect(run_validation, [], [_collect_error("scenarios")])
+
+        assert counts["T3"]["failed"] == 1
+        assert counts["T4"]["failed"] == 1
+        assert counts["T5"]["failed"] == 0
+
+    def test_aborted_session_exits_nonzero(self, run_validation, monkeypatch, capsys):
+        """An interrupted pytest session makes the runner exit non-zero."""
+        counts = _collect(run_validation, [], tiers=("T3",))
+        monkeypatch.setattr(
+            run_validation, "run_pytest",
+            lambda **kwargs: (counts, "", pytest.ExitCode.INTERRUPTED),
+        )
+        monkeypatch.setattr(
+            "sys.argv", ["run_validation.py", "--offline", "--json", "--tier", "T3"]
+        )
+
+        with pytest.raises(SystemExit) as exc_info:
+            run_validation.main()
+
+        assert exc_info.value.code == pytest.ExitCode.INTERRUPTED
+        assert "INTERRUPTED" in capsys.readouterr().err
+
+    def test_collect_error_interrupts_parallel_run(self, run_validation, monkeypatch):
+        """A collect error aborts the run even when xdist kept testing."""
+        def fake_main(args, plugins):
+            plugins[0].pytest_collectreport(
+                _collect_error("scenarios/tier4_schema/test_broken.py")
+            )
+            return pytest.ExitCode.OK
+
+        monkeypatch.setattr(run_validation.pytest, "main", fake_main)
+
+        counts, _, exit_code = run_validation.run_pytest(tiers=["T3"], offline=True)
+
+        assert exit_code == pytest.ExitCode.INTERRUPTED
+        assert counts["T3"]["failed"] == 0
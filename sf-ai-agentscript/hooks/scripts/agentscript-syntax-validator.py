@@ -21,12 +21,43 @@ Usage:
     Output: Diagnostic messages to stdout (or empty if valid)
 """
 
+import functools
 import json
 import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Set, Tuple
+
+
+# Patterns compiled once at import, shared by every validator instance
+_RE_TOP_LEVEL_BLOCK = re.compile(r'^(system|variables|language|connections|topic|start_agent)\s*:')
+# Every token the structural checks need, in file order. The outer named
+# group of each alternative is the match's lastgroup:
+#   block          system:/config: header
+#   header         topic/start_agent header; "named" is set when a name
+#                  follows on the line, "defined" holds "topic <name>:"
+#   ref            @topic reference; "referenced" is only looked ahead at,
+#                  so the name is still scanned for other tokens
+#   boolean        "= true" style literal with its value
+#   mutable_linked variable declared both mutable and linked
+_RE_TOKENS = re.compile(
+    r'^[^\S\n]*(?:(?P<block>system:|config:)'
+    r'|(?P<header>(?P<keyword>topic|start_agent)(?=(?P<named> (?=.*\S))?)'
+    r'(?:[^\S\n]+(?P<defined>\w+):)?))'
+    r'|(?P<ref>@topic\.(?=(?P<referenced>\w+)))'
+    r'|(?P<boolean>=[^\S\n]*(?P<value>(?i:true|false))[^\S\n]*(?:#|$))'
+    r'|(?P<mutable_linked>(?i:mutable[^\S\n]+linked|linked[^\S\n]+mutable))',
+    re.MULTILINE
+)
+# Variable suffixes that mark a post-action check
+_RE_POST_ACTION_FLAG = re.compile(r'_(?:status|done|complete|processed)')
+# Lines whose leading whitespace contains a tab / a space
+_RE_TAB_INDENT = re.compile(r'^[^\S\n]*\t', re.MULTILINE)
+_RE_SPACE_INDENT = re.compile(r'^[^\S\n]* ', re.MULTILINE)
+
+# Line prefixes that end an instructions block
+INSTRUCTIONS_END_PREFIXES = ('actions:', 'topic ', 'start_agent ')
 
 
 class AgentScriptValidator:
@@ -35,9 +66,9 @@ class AgentScriptValidator:
     def __init__(self, content: str, file_path: str):
         self.content = content
         self.file_path = file_path
-        self.lines = content.split('\n')
         self.errors: List[Tuple[int, str, str]] = []  # (line_num, severity, message)
         self.warnings: List[Tuple[int, str, str]] = []
+        self._seen_issues: Set[Tuple[int, str, str]] = set()
 
     def validate(self) -> dict:
         """Run all validations and return results."""
@@ -56,93 +87,130 @@ class AgentScriptValidator:
             "file_path": self.file_path,
         }
 
+    @functools.cached_property
+    def lines(self) -> List[str]:
+        """Content split into lines, only for the checks that track block state."""
+        return self.content.split('\n')
+
+    @functools.cached_property
+    def _tokens(self) -> dict:
+        """
+        Tokenize content in one pass over _RE_TOKENS.
+
+        Block headers, topic definitions and references, boolean literals
+        and mutable/linked conflicts are all collected here, so the checks
+        below only post-process these sets and lists.
+        """
+        tokens = {
+            "blocks": set(),  # 'system:', 'config:', 'topic ', 'start_agent '
+            "defined_topics": set(),
+            "topic_refs": [],  # (line_num, topic_name)
+            "booleans": [],  # (line_num, value), first per line
+            "mutable_linked": [],  # line_num, first per line
+        }
+        booleans = tokens["booleans"]
+        mutable_linked = tokens["mutable_linked"]
+
+        line_num, last_pos = 1, 0
+        for match in _RE_TOKENS.finditer(self.content):
+            line_num += self.content.count('\n', last_pos, match.start())
+            last_pos = match.start()
+
+            kind = match.lastgroup
+            if kind == "ref":
+                tokens["topic_refs"].append((line_num, match.group("referenced")))
+            elif kind == "boolean":
+                if not booleans or booleans[-1][0] != line_num:
+                    booleans.append((line_num, match.group("value")))
+            elif kind == "mutable_linked":
+                if not mutable_linked or mutable_linked[-1] != line_num:
+                    mutable_linked.append(line_num)
+            elif kind == "block":
+                tokens["blocks"].add(match.group("block"))
+            else:
+                if match.group("named"):
+                    tokens["blocks"].add(match.group("keyword") + ' ')
+                if match.group("defined"):
+                    tokens["defined_topics"].add(match.group("defined"))
+
+        return tokens
+
+    def _add_issue(self, line_num: int, severity: str, message: str):
+        """Record an error or warning, skipping exact repeats."""
+        issue = (line_num, severity, message)
+        if issue in self._seen_issues:
+            return
+        self._seen_issues.add(issue)
+
+        if severity == "error":
+            self.errors.append(issue)
+        else:
+            self.warnings.append(issue)
+
+    def _line_number(self, pos: int) -> int:
+        """1-based line number of a character offset in content."""
+        return self.content.count('\n', 0, pos) + 1
+
     def _check_mixed_indentation(self):
         """Check for mixed tabs and spaces."""
-        has_tabs = False
-        has_spaces = False
-        tab_line = None
-        space_line = None
-
-        for i, line in enumerate(self.lines, 1):
-            # Check leading whitespace
-            leading = len(line) - len(line.lstrip())
-            if leading > 0:
-                leading_chars = line[:leading]
-                if '\t' in leading_chars:
-                    has_tabs = True
-                    if tab_line is None:
-                        tab_line = i
-                if ' ' in leading_chars:
-                    has_spaces = True
-                    if space_line is None:
-                        space_line = i
-
-        if has_tabs and has_spaces:
-            self.errors.append((
-                tab_line or 1,
-                "error",
-                f"Mixed tabs and spaces detected. Tabs first seen on line {tab_line}, "
-                f"spaces first seen on line {space_line}. Use consistent indentation "
-                "(all tabs OR all spaces)."
-            ))
+        # Without a tab anywhere the indentation cannot be mixed
+        if '\t' not in self.content:
+            return
+
+        # First line indented with a tab / with a space, found by the regex
+        # engine instead of slicing the leading whitespace of every line
+        tab_match = _RE_TAB_INDENT.search(self.content)
+        if tab_match is None:
+            return
+        space_match = _RE_SPACE_INDENT.search(self.content)
+        if space_match is None:
+            return
+
+        tab_line = self._line_number(tab_match.start())
+        space_line = self._line_number(space_match.start())
+        self._add_issue(
+            tab_line,
+            "error",
+            f"Mixed tabs and spaces detected. Tabs first seen on line {tab_line}, "
+            f"spaces first seen on line {space_line}. Use consistent indentation "
+            "(all tabs OR all spaces)."
+        )
 
     def _check_boolean_case(self):
         """Check for lowercase boolean values."""
-        # Pattern to match boolean assignments
-        bool_pattern = re.compile(r'=\s*(true|false)\s*(?:#|$)', re.IGNORECASE)
-
-        for i, line in enumerate(self.lines, 1):
-            match = bool_pattern.search(line)
-            if match:
-                value = match.group(1)
-                if value.lower() == 'true' and value != 'True':
-                    self.errors.append((
-                        i,
-                        "error",
-                        f"Boolean must be capitalized: use 'True' instead of '{value}'"
-                    ))
-                elif value.lower() == 'false' and value != 'False':
-                    self.errors.append((
-                        i,
-                        "error",
-                        f"Boolean must be capitalized: use 'False' instead of '{value}'"
-                    ))
+        for i, value in self._tokens["booleans"]:
+            if value.lower() == 'true' and value != 'True':
+                self._add_issue(
+                    i,
+                    "error",
+                    f"Boolean must be capitalized: use 'True' instead of '{value}'"
+                )
+            elif value.lower() == 'false' and value != 'False':
+                self._add_issue(
+                    i,
+                    "error",
+                    f"Boolean must be capitalized: use 'False' instead of '{value}'"
+                )
 
     def _check_required_blocks(self):
         """Check for required blocks: system, config, topic, start_agent."""
-        required = {
-            'system:': False,
-            'config:': False,
-            'topic ': False,  # topic followed by name
-            'start_agent ': False,  # start_agent followed by name
-        }
+        required = ('system:', 'config:', 'topic ', 'start_agent ')
+        found = self._tokens["blocks"]
 
-        for line in self.lines:
-            stripped = line.strip()
-            if stripped.startswith('system:'):
-                required['system:'] = True
-            elif stripped.startswith('config:'):
-                required['config:'] = True
-            elif stripped.startswith('topic '):
-                required['topic '] = True
-            elif stripped.startswith('start_agent '):
-                required['start_agent '] = True
-
-        missing = [k.strip(':').strip() for k, v in required.items() if not v]
+        missing = [k.strip(':').strip() for k in required if k not in found]
         if missing:
-            self.errors.append((
+            self._add_issue(
                 1,
                 "error",
                 f"Missing required blocks: {', '.join(missing)}. "
                 "Every agent needs system, config, at least one topic, and start_agent."
-            ))
+            )
 
-    def _check_default_agent_user(self):
-        """Check if default_agent_user is present in config."""
+    def _config_has_default_agent_user(self) -> bool:
+        """Walk the lines for default_agent_user inside a config block."""
         in_config = False
-        has_default_agent_user = False
 
-        for i, line in enumerate(self.lines, 1):
+        for line in self.lines:
             stripped = line.strip()
 
             if stripped.startswith('config:'):
@@ -151,62 +219,71 @@ class AgentScriptValidator:
 
             # Check if we've left config block (another top-level block)
             if in_config and stripped and not stripped.startswith('#'):
-                if re.match(r'^(system|variables|language|connections|topic|start_agent)\s*:', stripped):
+                if _RE_TOP_LEVEL_BLOCK.match(stripped):
                     in_config = False
 
             if in_config and 'default_agent_user' in stripped:
-                has_default_agent_user = True
+                return True
+
+        return False
+
+    def _check_default_agent_user(self):
+        """Check if default_agent_user is present in config."""
+        # The line walk is only needed when both the key and a config
+        # header appear somewhere in the file
+        has_default_agent_user = (
+            'default_agent_user' in self.content
+            and 'config:' in self._tokens["blocks"]
+            and self._config_has_default_agent_user()
+        )
 
         if not has_default_agent_user:
-            self.errors.append((
+            self._add_issue(
                 1,
                 "error",
                 "Missing 'default_agent_user' in config block. This is REQUIRED. "
                 "Set it to a valid Einstein Agent User, e.g., default_agent_user: \"agent@yourorg.com\""
-            ))
+            )
 
     def _check_mutable_linked_conflict(self):
         """Check for variables declared as both mutable AND linked."""
-        pattern = re.compile(r'mutable\s+linked|linked\s+mutable', re.IGNORECASE)
-
-        for i, line in enumerate(self.lines, 1):
-            if pattern.search(line):
-                self.errors.append((
-                    i,
-                    "error",
-                    "Variable cannot be both 'mutable' AND 'linked'. "
-                    "Use 'mutable' for changeable state, 'linked' for external read-only data."
-                ))
+        for i in self._tokens["mutable_linked"]:
+            self._add_issue(
+                i,
+                "error",
+                "Variable cannot be both 'mutable' AND 'linked'. "
+                "Use 'mutable' for changeable state, 'linked' for external read-only data."
+            )
 
     def _check_undefined_topics(self):
         """Check for transitions to undefined topics."""
-        # Collect all defined topics
-        topic_pattern = re.compile(r'^(topic|start_agent)\s+(\w+):')
-        defined_topics = set()
-
-        for line in self.lines:
-            match = topic_pattern.match(line.strip())
-            if match:
-                defined_topics.add(match.group(2))
+        # A reference may precede its definition, so resolve them after the scan
+        references = self._tokens["topic_refs"]
 
-        # Find all topic references
-        ref_pattern = re.compile(r'@topic\.(\w+)')
+        # One warning per undefined topic, at its first reference
+        undefined = {topic_name for _, topic_name in references} - self._tokens["defined_topics"]
 
-        for i, line in enumerate(self.lines, 1):
-            for match in ref_pattern.finditer(line):
-                topic_name = match.group(1)
-                if topic_name not in defined_topics:
-                    self.warnings.append((
-                        i,
-                        "warning",
-                        f"Reference to undefined topic '@topic.{topic_name}'. "
-                        "Ensure this topic is defined in the agent script."
-                    ))
+        for line_num, topic_name in references:
+            if not undefined:
+                break
+            if topic_name not in undefined:
+                continue
+            undefined.discard(topic_name)
+            self._add_issue(
+                line_num,
+                "warning",
+                f"Reference to undefined topic '@topic.{topic_name}'. "
+                "Ensure this topic is defined in the agent script."
+            )
 
     def _check_post_action_position(self):
         """Warn if post-action checks appear after LLM instructions."""
         # This is a heuristic check - look for patterns that suggest
-        # post-action checks are at the bottom instead of the top
+        # post-action checks are at the bottom instead of the top.
+        # Only @variables. lines inside an instructions block can warn.
+        if 'instructions:' not in self.content or '@variables.' not in self.content:
+            return
+
         in_instructions = False
         seen_pipe_text = False
         instruction_start_line = None
@@ -222,7 +299,7 @@ class AgentScriptValidator:
 
             if in_instructions:
                 # Check if we've left instructions block
-                if stripped.startswith('actions:') or stripped.startswith('topic ') or stripped.startswith('start_agent '):
+                if stripped.startswith(INSTRUCTIONS_END_PREFIXES):
                     in_instructions = False
                     continue
 
@@ -232,15 +309,15 @@ class AgentScriptValidator:
 
                 # If we've seen pipe text and now see a post-action check pattern
                 if seen_pipe_text and '@variables.' in stripped:
-                    if any(x in stripped for x in ['_status', '_done', '_complete', '_processed']):
+                    if _RE_POST_ACTION_FLAG.search(stripped):
                         if stripped.startswith('if '):
-                            self.warnings.append((
+                            self._add_issue(
                                 i,
                                 "warning",
                                 "Post-action check appears AFTER LLM instructions. "
                                 "Consider moving this check to the TOP of instructions "
                                 "so it triggers on the topic loop after action completion."
-                            ))
+                            )
 
 
 def format_output(result: dict) -> str: